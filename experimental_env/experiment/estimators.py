@@ -1,18 +1,24 @@
 """Estimators for estimating parameters in second stage of experiment"""
 import random
 from abc import abstractmethod
-from concurrent.futures import as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from concurrent.futures.process import ProcessPoolExecutor
+from itertools import islice
+from math import ceil
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterator
 
+import numpy as np
 from tqdm import tqdm
 
 from experimental_env.utils import OrderedProblem, choose_best_mle
-from mpest import Problem
+from mpest import MixtureDistribution, Problem
 from mpest.em import EM
 from mpest.em.methods.l_moments_method import IndicatorEStep, LMomentsMStep
 from mpest.em.methods.likelihood_method import BayesEStep, LikelihoodMStep
 from mpest.em.methods.method import Method
 from mpest.optimizers import ALL_OPTIMIZERS
+from mpest.sample_sources import attach_shared_samples
 from mpest.utils import ANamed, Factory, ResultWithLog
 
 METHODS = {
@@ -23,21 +29,155 @@ METHODS = {
     "L-moments": [Factory(IndicatorEStep), Factory(LMomentsMStep)],
 }
 
+# Count of chunks of problems for every worker
+CHUNKS_PER_WORKER = 4
+# Max count of problems in chunk
+MAX_CHUNK_SIZE = 16
+
+
+def _estimate_chunk(
+    estimator: "AEstimator",
+    name: str,
+    size: int,
+    chunk: list[tuple[int, int, int, MixtureDistribution]],
+) -> list[tuple[int, ResultWithLog]]:
+    """
+    Helper function for multiprocessed estimation of chunk of problems.
+    Each problem is given by it's number, bounds of it's samples and initial mixture.
+    """
+
+    samples = attach_shared_samples(name, size)
+    return [
+        (number, estimator.solve(OrderedProblem(samples[start:stop], mixture, number)))
+        for number, start, stop, mixture in chunk
+    ]
+
 
 class AEstimator(ANamed):
     """
     An abstract class to describe the estimator.
     Implements the second stage of the experiment, evaluating the parameters of the mixture.
+
+    Problems are solved by persistent pool of worker processes,
+    which is shared by all estimate calls until shutdown.
+    Samples of all problems are placed into shared memory,
+    problems are submitted to workers by chunks.
     """
 
+    _executor: ProcessPoolExecutor | None = None
+    _executor_workers = 0
+
+    def __getstate__(self):
+        # Pool of workers isn't sent to workers
+        state = self.__dict__.copy()
+        state.pop("_executor", None)
+        state.pop("_executor_workers", None)
+        return state
+
     @abstractmethod
+    def solve(self, problem: OrderedProblem) -> ResultWithLog:
+        """
+        Estimating the parameters of the mixture of one problem.
+        Called by worker process, so methods are constructed there.
+        """
+
+    def executor(self, cpu_count: int) -> ProcessPoolExecutor:
+        """
+        Pool of worker processes, which is created once for given count of workers
+        """
+
+        if self._executor is None or self._executor_workers != cpu_count:
+            self.shutdown()
+            self._executor = ProcessPoolExecutor(max_workers=cpu_count)
+            self._executor_workers = cpu_count
+        return self._executor
+
+    def shutdown(self) -> None:
+        """
+        Shuts down pool of worker processes
+        """
+
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+            self._executor_workers = 0
+
+    def estimate_iter(
+        self,
+        problems: list[Problem],
+        cpu_count: int,
+        seed: int = 42,
+        max_in_flight: int | None = None,
+    ) -> Iterator[tuple[int, ResultWithLog]]:
+        """
+        The process of estimating the parameters of the mixture,
+        which yields numbers of problems and results as soon as they are ready
+
+        :param max_in_flight: Max count of chunks of problems,
+        which are submitted to workers at once. Default is twice count of workers.
+        """
+
+        random.seed(seed)
+        print(f"Starting {self.name} estimation")
+
+        size = sum(len(problem.samples) for problem in problems)
+        shared_memory = SharedMemory(create=True, size=max(1, size) * 8)
+        pending: set[Future] = set()
+        try:
+            samples = np.ndarray((size,), dtype=np.float64, buffer=shared_memory.buf)
+            tasks = []
+            start = 0
+            for i, problem in enumerate(problems):
+                stop = start + len(problem.samples)
+                samples[start:stop] = problem.samples
+                tasks.append((i, start, stop, problem.distributions))
+                start = stop
+            del samples
+
+            chunk_size = ceil(len(tasks) / (cpu_count * CHUNKS_PER_WORKER))
+            chunk_size = max(1, min(chunk_size, MAX_CHUNK_SIZE))
+            chunks = iter(range(0, len(tasks), chunk_size))
+            max_in_flight = max_in_flight or 2 * cpu_count
+
+            # Only a limited count of chunks is submitted at once,
+            # so results are kept in memory only until they are yielded
+            executor = self.executor(cpu_count)
+            with tqdm(total=len(problems)) as pbar:
+                while True:
+                    for i in islice(chunks, max_in_flight - len(pending)):
+                        pending.add(
+                            executor.submit(
+                                _estimate_chunk,
+                                self,
+                                shared_memory.name,
+                                size,
+                                tasks[i : i + chunk_size],
+                            )
+                        )
+                    if not pending:
+                        break
+
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for f in done:
+                        res = f.result()
+                        pbar.update(len(res))
+                        yield from res
+        finally:
+            for f in pending:
+                f.cancel()
+            shared_memory.close()
+            shared_memory.unlink()
+
     def estimate(
-        self, problems: list[Problem], cpu_count: int, seed: int
+        self, problems: list[Problem], cpu_count: int, seed: int = 42
     ) -> list[ResultWithLog]:
         """
         The process of estimating the parameters of the mixture
         """
 
+        output = dict(self.estimate_iter(problems, cpu_count, seed))
+        return [res for num, res in sorted(output.items())]
+
 
 class LikelihoodEstimator(AEstimator):
     """
@@ -58,40 +198,14 @@ class LikelihoodEstimator(AEstimator):
     def name(self):
         return "MLE-EM"
 
-    def _helper(self, problem: OrderedProblem):
-        """
-        Helper function for multiprocessed estimation
-        """
+    def solve(self, problem: OrderedProblem) -> ResultWithLog:
         methods = [
             Method(step[0].construct(), step[1].construct())
             for step in METHODS["Likelihood"]
         ]
         ems = [EM(self._brkpointer, self._dst_checker, method) for method in methods]
         results = [em.solve_logged(problem, True, True, True) for em in ems]
-        return choose_best_mle(problem.distributions, results), problem.number
-
-    def estimate(
-        self, problems: list[Problem], cpu_count: int, seed: int = 42
-    ) -> list[ResultWithLog]:
-        output = {}
-        random.seed(seed)
-        print("Starting Likelihood estimation")
-        ordered_problem = [
-            OrderedProblem(problem.samples, problem.distributions, i)
-            for i, problem in enumerate(problems)
-        ]
-        with tqdm(total=len(problems)) as pbar:
-            with ProcessPoolExecutor(max_workers=cpu_count) as executor:
-                fs = [
-                    executor.submit(self._helper, problem)
-                    for problem in ordered_problem
-                ]
-
-                for f in as_completed(fs):
-                    pbar.update()
-                    res = f.result()
-                    output[res[1]] = res[0]
-        return [res for num, res in sorted(output.items())]
+        return choose_best_mle(problem.distributions, results)
 
 
 class LMomentsEstimator(AEstimator):
@@ -107,38 +221,9 @@ class LMomentsEstimator(AEstimator):
     def name(self):
         return "LM-EM"
 
-    def _helper(self, problem: OrderedProblem):
-        """
-        Helper function for multiprocessed estimation
-        """
+    def solve(self, problem: OrderedProblem) -> ResultWithLog:
         steps = METHODS["L-moments"]
         new_method = Method(steps[0].construct(), steps[1].construct())
         em_factory = Factory(EM, self._brkpointer, self._dst_checker, new_method)
 
-        return (
-            em_factory.construct().solve_logged(problem, True, True, True),
-            problem.number,
-        )
-
-    def estimate(
-        self, problems: list[Problem], cpu_count: int, seed: int = 42
-    ) -> list[ResultWithLog]:
-        output = {}
-        random.seed(seed)
-        print("Starting L-moments estimation")
-        ordered_problem = [
-            OrderedProblem(problem.samples, problem.distributions, i)
-            for i, problem in enumerate(problems)
-        ]
-        with tqdm(total=len(problems)) as pbar:
-            with ProcessPoolExecutor(max_workers=cpu_count) as executor:
-                fs = [
-                    executor.submit(self._helper, problem)
-                    for problem in ordered_problem
-                ]
-                for f in as_completed(fs):
-                    pbar.update()
-                    res = f.result()
-                    output[res[1]] = res[0]
-
-        return [res for num, res in sorted(output.items())]
+        return em_factory.construct().solve_logged(problem, True, True, True)
@@ -1,8 +1,12 @@
 """ A module that provides an abstract class for performing the 2nd stage of the experiment """
 
+import os
 import warnings
 from abc import ABC, abstractmethod
 from pathlib import Path
+from queue import Queue
+from threading import Thread
+from typing import Iterator
 
 import numpy as np
 
@@ -10,8 +14,85 @@ from experimental_env.experiment.estimators import AEstimator
 from experimental_env.experiment.experiment_description import ExperimentDescription
 from experimental_env.experiment.experiment_saver import ExperimentSaver
 from experimental_env.preparation.dataset_description import DatasetDescrciption
-from mpest import Problem
+from mpest import MixtureDistribution, Problem
 from mpest.models import ALL_MODELS, AModel
+from mpest.utils import ResultWithLog
+
+MANIFEST_FILE = "manifest.txt"
+
+
+class _ResultWriter(Thread):
+    """
+    A thread that saves results of experiments and records them in manifest,
+    so results are dropped from memory as soon as they are saved.
+    Count of results, which are waiting for saving, is limited.
+    """
+
+    def __init__(self, manifest_p: Path, max_pending: int):
+        super().__init__(daemon=True)
+        self._queue: Queue = Queue(max_pending)
+        self._error: Exception | None = None
+
+        # pylint: disable=consider-using-with
+        self._manifest = open(manifest_p, "a+", encoding="utf-8")
+        # Terminate line, which was written partially
+        if self._manifest.tell() > 0:
+            self._manifest.seek(self._manifest.tell() - 1)
+            if self._manifest.read(1) != "\n":
+                self._manifest.write("\n")
+
+    def _save(
+        self,
+        key: str,
+        exp_dir: Path,
+        init_mixture: MixtureDistribution,
+        result: ResultWithLog,
+        ds_descr: DatasetDescrciption,
+    ) -> None:
+        # pylint: disable=too-many-arguments
+        result_descr = ExperimentDescription.from_result(init_mixture, result, ds_descr)
+        ExperimentSaver(exp_dir).save(result_descr)
+
+        self._manifest.write(f"{key}\n")
+        self._manifest.flush()
+        os.fsync(self._manifest.fileno())
+
+    def run(self):
+        with self._manifest:
+            while (item := self._queue.get()) is not None:
+                # Results are skipped after error, so producer isn't blocked
+                if self._error is not None:
+                    continue
+                try:
+                    self._save(*item)
+                except Exception as error:  # pylint: disable=broad-exception-caught
+                    self._error = error
+                del item
+
+    def put(
+        self,
+        key: str,
+        exp_dir: Path,
+        init_mixture: MixtureDistribution,
+        result: ResultWithLog,
+        ds_descr: DatasetDescrciption,
+    ) -> None:
+        """
+        Add result for saving, waits if there are too many results waiting.
+        """
+        # pylint: disable=too-many-arguments
+        if self._error is not None:
+            raise self._error
+        self._queue.put((key, exp_dir, init_mixture, result, ds_descr))
+
+    def close(self) -> None:
+        """
+        Wait for saving all results.
+        """
+        self._queue.put(None)
+        self.join()
+        if self._error is not None:
+            raise self._error
 
 
 class AExecutor(ABC):
@@ -41,34 +122,92 @@ class AExecutor(ABC):
         Function for generate problem any method user want.
         """
 
-    def execute(self, preparation_results: dict, estimator: AEstimator) -> None:
+    def _read_manifest(self) -> set[str]:
         """
-        Function for the execution of the second stage
+        Read keys of completed experiments from manifest.
+        Last line, which was written partially, is ignored.
+        """
+
+        manifest_p: Path = self._out_dir.joinpath(MANIFEST_FILE)
+        if not manifest_p.exists():
+            return set()
+        with open(manifest_p, "r", encoding="utf-8") as manifest:
+            return {line.strip() for line in manifest if line.endswith("\n")}
+
+    def execute(
+        self, preparation_results: dict, estimator: AEstimator, resume: bool = False
+    ) -> None:
+        """
+        Function for the execution of the second stage.
+        Results of experiments are saved as soon as they are ready
+        and recorded in manifest as completed.
 
         :param preparation_results: Data from the first stage received from the parser.
         :param estimator: Estimator
+        :param resume: Skip experiments, which are recorded in manifest as completed.
         """
-        method_dir: Path = self._out_dir.joinpath(estimator.name)
-
-        for mixture_name, ds_descriptions in preparation_results.items():
-            mixture_name_dir: Path = method_dir.joinpath(mixture_name)
-            models = [ALL_MODELS[model_name] for model_name in mixture_name.split("_")]
+        completed = self._read_manifest() if resume else set()
+        self._out_dir.mkdir(parents=True, exist_ok=True)
+        writer = _ResultWriter(
+            self._out_dir.joinpath(MANIFEST_FILE), 2 * self._cpu_count
+        )
+        writer.start()
+
+        # Pool of workers of estimator is shared by all mixtures
+        try:
+            for mixture_name, ds_descriptions in preparation_results.items():
+                mixture_name_dir: Path = self._out_dir.joinpath(
+                    estimator.name, mixture_name
+                )
+                key = f"{estimator.name}/{mixture_name}"
+                ds_descriptions = [
+                    ds_descr
+                    for ds_descr in ds_descriptions
+                    if f"{key}/{ds_descr.exp_num}" not in completed
+                ]
+                if not ds_descriptions:
+                    continue
+
+                for ds_descr, init_mixture, result in self._execute_mixture(
+                    mixture_name, ds_descriptions, estimator
+                ):
+                    writer.put(
+                        f"{key}/{ds_descr.exp_num}",
+                        mixture_name_dir.joinpath(f"experiment_{ds_descr.exp_num}"),
+                        init_mixture,
+                        result,
+                        ds_descr,
+                    )
+        finally:
+            try:
+                writer.close()
+            finally:
+                estimator.shutdown()
+
+    def _execute_mixture(
+        self,
+        mixture_name: str,
+        ds_descriptions: list[DatasetDescrciption],
+        estimator: AEstimator,
+    ) -> Iterator[tuple[DatasetDescrciption, MixtureDistribution, ResultWithLog]]:
+        """
+        Function for the execution of the second stage for one mixture,
+        which yields datasets, initial mixtures and results as soon as they are ready.
+        """
+        models = [ALL_MODELS[model_name] for model_name in mixture_name.split("_")]
 
-            problems = self.init_problems(ds_descriptions, models)
+        problems = self.init_problems(ds_descriptions, models)
 
+        results = estimator.estimate_iter(problems, self._cpu_count, self._seed)
+        while True:
             # Disable warnings and estimating params.
+            # Warnings are disabled only while estimating,
+            # so they aren't disabled in consumer of results.
             with warnings.catch_warnings():
                 warnings.simplefilter("ignore")
-                results = estimator.estimate(problems, self._cpu_count, self._seed)
+                item = next(results, None)
+            if item is None:
+                return
 
-            # Saving results
-            for i, ds_descr in enumerate(ds_descriptions):
-                exp_dir: Path = mixture_name_dir.joinpath(
-                    f"experiment_{ds_descr.exp_num}"
-                )
-                result = results[i]
-
-                result_descr = ExperimentDescription.from_result(
-                    problems[i].distributions, result, ds_descr
-                )
-                ExperimentSaver(exp_dir).save(result_descr)
+            i, result = item
+            yield ds_descriptions[i], problems[i].distributions, result
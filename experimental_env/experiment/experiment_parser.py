@@ -1,8 +1,13 @@
 """ A module containing a class for parsing the second stage of the experiment"""
 
+import json
 import os
+from collections import OrderedDict
+from functools import partial
 from pathlib import Path
+from typing import Callable, Sequence
 
+import numpy as np
 import yaml
 from numpy import genfromtxt
 
@@ -11,15 +16,73 @@ from experimental_env.experiment.experiment_description import (
     ExperimentDescription,
     StepDescription,
 )
+from experimental_env.experiment.experiment_saver import TRAJECTORY_FILE
 from experimental_env.preparation.dataset_description import DatasetDescrciption
 from experimental_env.utils import create_mixture_by_key, sort_human
+from mpest import Distribution, MixtureDistribution
+
+EXPERIMENTS_INDEX = "index.json"
+
+
+def _samples_not_found(exp_dir: Path) -> str:
+    """
+    Message of error, which is raised when samples of experiment aren't found
+    """
+
+    return (
+        f"Samples of experiment {exp_dir} aren't found, "
+        "datasets of the first stage must be given to parser"
+    )
+
+
+class TrajectorySteps(Sequence[StepDescription]):
+    """
+    Steps of experiment from trajectory file.
+    Mixture of step is created only when step is accessed.
+    """
+
+    def __init__(self, exp_dir: Path, init_mixture: MixtureDistribution):
+        """
+        Class constructor
+
+        :param exp_dir: The path to the directory of the experiment
+        :param init_mixture: Initial mixture, which gives models of distributions
+        """
+
+        with np.load(exp_dir.joinpath(TRAJECTORY_FILE)) as trajectory:
+            self._params: np.ndarray = np.asarray(trajectory["params"])
+            self._priors: np.ndarray = np.asarray(trajectory["priors"])
+            self._times: np.ndarray = np.asarray(trajectory["times"])
+        self._init_mixture = init_mixture
+
+    def __len__(self):
+        return len(self._times)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        dists = [
+            Distribution(d.model, p[: len(d.params)])
+            for d, p in zip(self._init_mixture, self._params[index])
+        ]
+        # Priors of dead distributions are saved as nan
+        step_mixture = MixtureDistribution.from_distributions(
+            dists, [None if np.isnan(p) else float(p) for p in self._priors[index]]
+        )
+        return StepDescription(step_mixture, float(self._times[index]))
 
 
 class ExperimentParser:
     """
     A class that parses the second stage of the experiment.
+    Steps are read from trajectory file, or from step directories,
+    if experiment was saved by older version of saver.
     """
 
+    def _get_trajectory(self, exp_dir: Path, init_mixture: MixtureDistribution):
+        return list(TrajectorySteps(exp_dir, init_mixture))
+
     def _get_steps(self, exp_dir: Path):
         steps = []
         for step in sort_human(os.listdir(exp_dir)):
@@ -38,28 +101,39 @@ class ExperimentParser:
 
         return steps
 
-    def parse(self, path: Path) -> ParserOutput:
+    def parse(self, path: Path, datasets: dict | None = None) -> ParserOutput:
         """
         The parsing method
 
         :param path: The path to the directory of the second stage of the experiment
+        :param datasets: Datasets of the first stage from SamplesDatasetParser,
+        which are used to get samples of experiments.
+        Results of experiments in trajectory format don't contain samples,
+        so datasets are required for them.
+        :raises FileNotFoundError: If samples of experiment aren't found
         """
         output = {}
 
         # Open each mixture dir
         for mixture_name in os.listdir(path):
             mixture_name_dir: Path = path.joinpath(mixture_name)
+            if not mixture_name_dir.is_dir():
+                continue
             mixture_name_list = []
+            mixture_samples = {
+                ds_descr.exp_num: ds_descr.samples
+                for ds_descr in (datasets or {}).get(mixture_name, [])
+            }
 
             # Open each experiment dir
             for exp_name in os.listdir(mixture_name_dir):
+                # Skip hidden files, e.g. unfinished results of experiments
+                if exp_name.startswith("."):
+                    continue
                 experiment_dir: Path = mixture_name_dir.joinpath(exp_name)
                 samples_p: Path = experiment_dir.joinpath("samples.csv")
                 config_p: Path = experiment_dir.joinpath("config.yaml")
 
-                # Get samples
-                samples = genfromtxt(samples_p, delimiter=",")
-
                 # Get base mixture
                 with open(config_p, "r", encoding="utf-8") as config_file:
                     config = yaml.safe_load(config_file)
@@ -70,8 +144,19 @@ class ExperimentParser:
                     base_mixture = create_mixture_by_key(config, "distributions")
                     init_mixture = create_mixture_by_key(config, "init_distributions")
 
+                # Get samples
+                if samples_p.exists():
+                    samples = genfromtxt(samples_p, delimiter=",")
+                elif exp_num in mixture_samples:
+                    samples = mixture_samples[exp_num]
+                else:
+                    raise FileNotFoundError(_samples_not_found(experiment_dir))
+
                 # Get all steps
-                steps = self._get_steps(experiment_dir)
+                if experiment_dir.joinpath(TRAJECTORY_FILE).exists():
+                    steps = self._get_trajectory(experiment_dir, init_mixture)
+                else:
+                    steps = self._get_steps(experiment_dir)
 
                 # Save results of experiment
                 ds_descr = DatasetDescrciption(
@@ -86,3 +171,195 @@ class ExperimentParser:
 
             output[mixture_name] = mixture_name_list
         return output
+
+
+class LRUCache:
+    """
+    A class of cache, which keeps a limited count of recently used values.
+    """
+
+    def __init__(self, maxsize: int):
+        """
+        Class constructor
+
+        :param maxsize: Max count of values in cache
+        """
+
+        self._maxsize = maxsize
+        self._values: OrderedDict = OrderedDict()
+
+    def get(self, key, load: Callable):
+        """
+        Get value from cache or load it, if it isn't in cache
+
+        :param key: Key of value
+        :param load: Function, which loads value
+        """
+
+        if key in self._values:
+            self._values.move_to_end(key)
+            return self._values[key]
+
+        value = load()
+        self._values[key] = value
+        if len(self._values) > self._maxsize:
+            self._values.popitem(last=False)
+        return value
+
+
+class LazyExperimentDescription(ExperimentDescription):
+    """
+    A class containing information about experiment,
+    which loads steps and samples from disk only when they are accessed.
+    Loaded steps and samples are kept in cache shared by all experiments of parser.
+    """
+
+    def __init__(
+        self,
+        experiment_dir: Path,
+        init_mixture: MixtureDistribution,
+        ds_descr: DatasetDescrciption,
+        error: bool,
+        cache: LRUCache,
+        load_steps: Callable[[], Sequence[StepDescription]],
+    ):
+        # pylint: disable=too-many-arguments
+        super().__init__()
+        self._experiment_dir = experiment_dir
+        self._init_mixture = init_mixture
+        self._ds_descr = ds_descr
+        self._error = error
+        self._cache = cache
+        self._load_steps = load_steps
+
+    def _load_samples(self):
+        return genfromtxt(self._experiment_dir.joinpath("samples.csv"), delimiter=",")
+
+    @property
+    def steps(self) -> Sequence[StepDescription]:
+        return self._cache.get(("steps", self._experiment_dir), self._load_steps)
+
+    @property
+    def samples(self):
+        if self._ds_descr.samples is not None:
+            return self._ds_descr.samples
+        if not self._experiment_dir.joinpath("samples.csv").exists():
+            raise FileNotFoundError(_samples_not_found(self._experiment_dir))
+        return self._cache.get(("samples", self._experiment_dir), self._load_samples)
+
+    def __next__(self):
+        return self.steps[0]
+
+    def __iter__(self):
+        return iter(self.steps)
+
+
+class LazyExperimentParser(ExperimentParser):
+    """
+    A class that parses the second stage of the experiment lazily.
+
+    Configs of experiments are kept in index file in the directory of method,
+    so only configs of new or changed experiments are parsed.
+    Steps and samples are loaded when they are accessed.
+    """
+
+    def __init__(self, cache_size: int = 128):
+        """
+        Class constructor
+
+        :param cache_size: Max count of experiments, whose steps or samples
+        are kept in memory.
+        """
+
+        self._cache = LRUCache(cache_size)
+
+    def _load_steps(
+        self, exp_dir: Path, init_mixture: MixtureDistribution
+    ) -> Sequence[StepDescription]:
+        if exp_dir.joinpath(TRAJECTORY_FILE).exists():
+            return TrajectorySteps(exp_dir, init_mixture)
+        return self._get_steps(exp_dir)
+
+    def _update_index(self, path: Path) -> dict:
+        """
+        Read index of configs of experiments and update it with changed experiments
+        """
+
+        index_p: Path = path.joinpath(EXPERIMENTS_INDEX)
+        index = {}
+        if index_p.exists():
+            with open(index_p, "r", encoding="utf-8") as index_file:
+                index = json.load(index_file)
+
+        new_index = {}
+        for mixture_name in os.listdir(path):
+            mixture_name_dir: Path = path.joinpath(mixture_name)
+            if not mixture_name_dir.is_dir():
+                continue
+
+            entries = index.get(mixture_name, {})
+            new_entries = {}
+            for exp_name in os.listdir(mixture_name_dir):
+                if exp_name.startswith("."):
+                    continue
+                config_p: Path = mixture_name_dir.joinpath(exp_name, "config.yaml")
+                mtime = config_p.stat().st_mtime_ns
+
+                entry = entries.get(exp_name)
+                if entry is None or entry["mtime"] != mtime:
+                    with open(config_p, "r", encoding="utf-8") as config_file:
+                        entry = {"mtime": mtime, "config": yaml.safe_load(config_file)}
+                new_entries[exp_name] = entry
+            new_index[mixture_name] = new_entries
+
+        if new_index != index:
+            index_tmp = path.joinpath(f"{EXPERIMENTS_INDEX}.tmp")
+            with open(index_tmp, "w", encoding="utf-8") as index_file:
+                json.dump(new_index, index_file)
+            os.replace(index_tmp, index_p)
+
+        return new_index
+
+    def parse(self, path: Path, datasets: dict | None = None) -> ParserOutput:
+        """
+        The parsing method
+
+        :param path: The path to the directory of the second stage of the experiment
+        :param datasets: Datasets of the first stage from SamplesDatasetParser,
+        which are used to get samples of experiments.
+        """
+        output = {}
+
+        for mixture_name, entries in self._update_index(path).items():
+            mixture_name_dir: Path = path.joinpath(mixture_name)
+            mixture_samples = {
+                ds_descr.exp_num: ds_descr.samples
+                for ds_descr in (datasets or {}).get(mixture_name, [])
+            }
+
+            mixture_name_list = []
+            for exp_name, entry in entries.items():
+                config = entry["config"]
+                exp_num = config["exp_num"]
+
+                ds_descr = DatasetDescrciption(
+                    config["samples_size"],
+                    mixture_samples.get(exp_num),
+                    create_mixture_by_key(config, "distributions"),
+                    exp_num,
+                )
+                experiment_dir: Path = mixture_name_dir.joinpath(exp_name)
+                init_mixture = create_mixture_by_key(config, "init_distributions")
+                mixture_name_list.append(
+                    LazyExperimentDescription(
+                        experiment_dir,
+                        init_mixture,
+                        ds_descr,
+                        config["error"],
+                        self._cache,
+                        partial(self._load_steps, experiment_dir, init_mixture),
+                    )
+                )
+
+            output[mixture_name] = mixture_name_list
+        return output
@@ -1,5 +1,7 @@
 """ A module with saver for second stage of experiment """
 
+import os
+import shutil
 from pathlib import Path
 
 import numpy as np
@@ -7,17 +9,30 @@ from ruamel.yaml import YAML
 
 from experimental_env.experiment.experiment_description import ExperimentDescription
 
+TRAJECTORY_FILE = "trajectory.npz"
+
 
 class ExperimentSaver:
     """
-    A class that implements saving the results of the second stage
+    A class that implements saving the results of the second stage.
+
+    Steps of experiment are saved as dense arrays into one trajectory file:
+    params of distributions padded by nan, prior probabilities and times of steps.
+    Samples aren't saved, they are referenced by mixture name and experiment number
+    of dataset from the first stage.
+
+    Results are written into hidden temporary directory. Previous directory
+    of experiment is moved aside to hidden directory, then temporary directory
+    takes it's place and only after that previous results are deleted,
+    so directory of experiment is never written partially and previous results
+    are kept until new ones are in place.
     """
 
     def __init__(self, path: Path):
         self._out_dir = path
 
-        if not path.exists():
-            path.mkdir(parents=True)
+        if not path.parent.exists():
+            path.parent.mkdir(parents=True)
 
     def save(self, descr: ExperimentDescription):
         """
@@ -25,21 +40,37 @@ class ExperimentSaver:
 
         :param descr: An object containing information about the current experiment
         """
+        tmp_dir: Path = self._out_dir.with_name(f".{self._out_dir.name}.tmp")
+        if tmp_dir.exists():
+            shutil.rmtree(tmp_dir)
+        tmp_dir.mkdir()
+
         yaml = YAML()
         yaml.default_flow_style = False
 
-        with open(self._out_dir / "config.yaml", "w", encoding="utf-8") as config:
+        with open(tmp_dir / "config.yaml", "w", encoding="utf-8") as config:
             yaml.dump(descr.to_yaml_format(), config)
 
-        np.savetxt(self._out_dir / "samples.csv", descr.samples, delimiter=",")
+        steps = descr.steps
+        dists_count = len(descr.init_mixture)
+        params_count = max(len(d.params) for d in descr.init_mixture)
 
-        for i, step_descr in enumerate(descr):
-            step_dir: Path = self._out_dir.joinpath(f"step_{i + 1}")
-            if not step_dir.exists():
-                step_dir.mkdir()
+        params = np.full((len(steps), dists_count, params_count), np.nan)
+        priors = np.full((len(steps), dists_count), np.nan)
+        for i, step_descr in enumerate(steps):
+            for j, d in enumerate(step_descr.result_mixture):
+                params[i, j, : len(d.params)] = d.params
+                if d.prior_probability:
+                    priors[i, j] = d.prior_probability
+        times = np.array([step_descr.time for step_descr in steps], dtype=float)
 
-            # Save step config
-            yaml_path: Path = step_dir.joinpath("config.yaml")
+        np.savez(tmp_dir / TRAJECTORY_FILE, params=params, priors=priors, times=times)
 
-            with open(yaml_path, "w", encoding="utf-8") as config:
-                yaml.dump(step_descr.to_yaml_format(), config)
+        old_dir: Path = self._out_dir.with_name(f".{self._out_dir.name}.old")
+        if old_dir.exists():
+            shutil.rmtree(old_dir)
+        if self._out_dir.exists():
+            os.replace(self._out_dir, old_dir)
+        os.replace(tmp_dir, self._out_dir)
+        if old_dir.exists():
+            shutil.rmtree(old_dir)
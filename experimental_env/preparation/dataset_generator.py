@@ -8,6 +8,7 @@ from tqdm import tqdm
 from experimental_env.mixture_generators.dataset_mixture_generator import (
     DatasetMixtureGenerator,
 )
+from experimental_env.preparation.dataset_pack import DatasetPackSaver
 from experimental_env.preparation.dataset_saver import DatasetDescrciption, DatasetSaver
 from mpest.distribution import Distribution
 from mpest.mixture_distribution import MixtureDistribution
@@ -34,11 +35,16 @@ class RandomDatasetGenerator:
         models: list[type[AModel]],
         working_path: Path,
         exp_count: int = 10,
+        packed: bool = False,
     ):
         """
         A function that generates datasets based on random mixture.
+
+        :param packed: Save datasets of mixture into one binary pack
+        instead of directory for each experiment.
         """
 
+        pack_saver = DatasetPackSaver(working_path)
         with tqdm(total=exp_count) as tbar:
             for i in range(exp_count):
                 tbar.update()
@@ -46,10 +52,15 @@ class RandomDatasetGenerator:
                 samples = mixture.generate(samples_size)
                 descr = DatasetDescrciption(samples_size, samples, mixture, i + 1)
 
+                if packed:
+                    pack_saver.save_dataset(descr)
+                    continue
+
                 mixture_name_dir: Path = working_path.joinpath(descr.get_dataset_name())
                 exp_dir: Path = mixture_name_dir.joinpath(f"experiment_{i + 1}")
                 saver = DatasetSaver(exp_dir)
                 saver.save_dataset(descr)
+        pack_saver.flush()
 
 
 class ConcreteDatasetGenerator:
@@ -71,13 +82,23 @@ class ConcreteDatasetGenerator:
         self._dists.append(Distribution.from_params(model, params))
         self._priors.append(prior)
 
-    def generate(self, samples_size: int, working_path: Path, exp_count: int):
+    def generate(
+        self,
+        samples_size: int,
+        working_path: Path,
+        exp_count: int,
+        packed: bool = False,
+    ):
         """
         A function that generates a dataset based on a user's mixture.
 
+        :param packed: Save datasets of mixture into one binary pack
+        instead of directory for each experiment.
+
         TODO: Figure out how to implement overwriting or adding additional experiments to existing ones.
         """
 
+        pack_saver = DatasetPackSaver(working_path)
         saved_exp_count = 0
         for i in range(1000):
             if saved_exp_count >= exp_count:
@@ -90,9 +111,17 @@ class ConcreteDatasetGenerator:
             mixture_name_dir: Path = working_path.joinpath(descr.get_dataset_name())
             exp_dir: Path = mixture_name_dir.joinpath(f"experiment_{i+1}")
 
+            if packed:
+                if pack_saver.contains(descr):
+                    continue
+                pack_saver.save_dataset(descr)
+                saved_exp_count += 1
+                continue
+
             if exp_dir.exists():
                 continue
 
             saver = DatasetSaver(exp_dir)
             saver.save_dataset(descr)
             saved_exp_count += 1
+        pack_saver.flush()
@@ -0,0 +1,176 @@
+"""
+A module containing binary pack of datasets of one mixture.
+Pack is a directory with samples of all experiments in one .npy file
+and index with name of samples file, configs of experiments
+and bounds of their samples.
+"""
+
+import json
+import os
+import warnings
+from pathlib import Path
+from uuid import uuid4
+
+import numpy as np
+
+from experimental_env.preparation.dataset_description import DatasetDescrciption
+from experimental_env.utils import create_mixture_by_key
+
+PACK_INDEX = "index.json"
+
+
+def is_dataset_pack(path: Path) -> bool:
+    """
+    Checks that directory of mixture contains pack of datasets
+
+    :param path: Path to directory of mixture
+    """
+    return path.joinpath(PACK_INDEX).exists()
+
+
+def load_dataset_pack(path: Path) -> list[DatasetDescrciption]:
+    """
+    Loads datasets from pack.
+    Samples aren't copied, they are memory-mapped views of samples file.
+
+    :param path: Path to directory of mixture
+    """
+
+    with open(path.joinpath(PACK_INDEX), "r", encoding="utf-8") as index_file:
+        index = json.load(index_file)
+    samples = np.load(path.joinpath(index["samples"]), mmap_mode="r")
+
+    return [
+        DatasetDescrciption(
+            config["samples_size"],
+            samples[config["start"] : config["stop"]],
+            create_mixture_by_key(config, "distributions"),
+            config["exp_num"],
+        )
+        for config in index["datasets"]
+    ]
+
+
+def _remove_unused_samples(path: Path, samples_name: str) -> None:
+    """
+    Removes samples files of previous versions of pack,
+    which could be left also by interrupted flush
+    """
+
+    for samples_p in path.glob("samples-*.npy"):
+        if samples_p.name == samples_name:
+            continue
+        try:
+            samples_p.unlink()
+        except FileNotFoundError:
+            # File is already removed by another flush
+            pass
+        except PermissionError as error:
+            # File can be still memory-mapped on some platforms,
+            # it's removed by one of the next flushes
+            warnings.warn(f"Unused samples file isn't removed: {error}")
+
+
+class DatasetPackSaver:
+    """
+    A class that saves datasets into packs, one pack for each mixture.
+    Datasets are kept in memory until flush.
+    Datasets, which are already saved in pack, are replaced by new ones
+    with the same experiment number.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Class constructor
+
+        :param path: The path in which directories of mixtures will lie
+        """
+
+        self._out_dir = path
+        self._datasets: dict[str, dict[int, DatasetDescrciption]] = {}
+        self._changed: set[str] = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+
+    def contains(self, descr: DatasetDescrciption) -> bool:
+        """
+        Checks that dataset with the same mixture and experiment number
+        is saved or going to be saved
+        """
+
+        name = descr.get_dataset_name()
+        self._load(name)
+        return descr.exp_num in self._datasets[name]
+
+    def save_dataset(self, descr: DatasetDescrciption) -> None:
+        """
+        Add dataset to pack of it's mixture
+        """
+
+        name = descr.get_dataset_name()
+        self._load(name)
+        self._datasets[name][descr.exp_num] = descr
+        self._changed.add(name)
+
+    def flush(self) -> None:
+        """
+        Write packs of mixtures with new datasets
+        """
+
+        for name in sorted(self._changed):
+            datasets = self._datasets[name]
+            mixture_name_dir: Path = self._out_dir.joinpath(name)
+            mixture_name_dir.mkdir(parents=True, exist_ok=True)
+
+            descriptions = [datasets[exp_num] for exp_num in sorted(datasets)]
+            samples = np.concatenate(
+                [np.asarray(d.samples, dtype=np.float64) for d in descriptions]
+                or [np.empty(0)]
+            )
+
+            datasets_index = []
+            start = 0
+            for descr in descriptions:
+                config = descr.to_yaml_format()
+                config["start"] = start
+                config["stop"] = start + len(descr.samples)
+                start = config["stop"]
+                datasets_index.append(config)
+
+            # Samples are written into new file, which is referenced by index.
+            # Only index is replaced, so pack is never read partially written
+            # or with samples of another version of index.
+            samples_name = f"samples-{uuid4().hex}.npy"
+            with open(mixture_name_dir.joinpath(samples_name), "wb") as samples_file:
+                np.save(samples_file, samples)
+            index_tmp = mixture_name_dir.joinpath(f"{PACK_INDEX}.tmp")
+            with open(index_tmp, "w", encoding="utf-8") as index_file:
+                json.dump(
+                    {"samples": samples_name, "datasets": datasets_index}, index_file
+                )
+            os.replace(index_tmp, mixture_name_dir.joinpath(PACK_INDEX))
+            _remove_unused_samples(mixture_name_dir, samples_name)
+
+            self._datasets[name] = {
+                descr.exp_num: descr for descr in load_dataset_pack(mixture_name_dir)
+            }
+        self._changed.clear()
+
+    def _load(self, name: str) -> None:
+        """
+        Load saved pack of mixture, if it isn't loaded yet
+        """
+
+        if name in self._datasets:
+            return
+
+        mixture_name_dir: Path = self._out_dir.joinpath(name)
+        self._datasets[name] = (
+            {descr.exp_num: descr for descr in load_dataset_pack(mixture_name_dir)}
+            if is_dataset_pack(mixture_name_dir)
+            else {}
+        )
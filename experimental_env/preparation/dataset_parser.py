@@ -6,6 +6,7 @@ import yaml
 from numpy import genfromtxt
 
 from experimental_env.preparation.dataset_description import DatasetDescrciption
+from experimental_env.preparation.dataset_pack import is_dataset_pack, load_dataset_pack
 from experimental_env.utils import create_mixture_by_key
 
 
@@ -17,6 +18,7 @@ class SamplesDatasetParser:
     def parse(self, path: Path) -> dict:
         """
         A function that implements parsing.
+        Mixtures, which are saved as packs of datasets, are loaded from packs.
 
         :param path: Path to datasets
         """
@@ -25,6 +27,10 @@ class SamplesDatasetParser:
         # Open each mixture dir
         for mixture_name in os.listdir(path):
             mixture_name_dir: Path = path.joinpath(mixture_name)
+            if is_dataset_pack(mixture_name_dir):
+                output[mixture_name] = load_dataset_pack(mixture_name_dir)
+                continue
+
             mixture_name_dict = []
 
             # Open each experiment dir
@@ -3,7 +3,7 @@ mpest package which contains realization of em algorithm
 for solving the parameter estimation of mixture distribution problem __init__ file
 """
 
-from mpest import em, models, optimizers, utils
+from mpest import em, models, optimizers, sample_sources, utils
 from mpest.distribution import Distribution
 from mpest.mixture_distribution import DistributionInMixture, MixtureDistribution
 from mpest.problem import Problem, Result
@@ -2,4 +2,8 @@
 Module which contains EM solver for parameter estimation of mixture distribution problem
 """
 
+from mpest.em.accelerated_em import AcceleratedEM
+from mpest.em.batch_em import BatchEM
 from mpest.em.em import EM
+from mpest.em.multi_start_em import MultiStartEM
+from mpest.em.online_em import OnlineEM
@@ -0,0 +1,106 @@
+"""Module which represents EM algorithm with SQUAREM acceleration"""
+
+import numpy as np
+
+from mpest.em.em import EM
+from mpest.em.mixture_state import MixtureState
+from mpest.types import Samples
+from mpest.utils import ResultWithError
+
+
+class AcceleratedEM(EM):
+    """
+    Class which represents EM algorithm with SQUAREM acceleration.
+
+    The method step is considered as fixed-point map F of vector, which contains
+    params and logarithms of prior probabilities of active distributions.
+    Every EM step makes two method steps x1 = F(x0), x2 = F(x1),
+    extrapolates x' = x0 - 2 * a * r + a^2 * v, where r = x1 - x0, v = x2 - x1 - r,
+    a = -|r| / |v|, and makes stabilizing method step F(x').
+
+    The extrapolation is rejected in favor of x2, when log-likelihood of x'
+    calculated by E step is less than one of x1, when any distribution is degenerated
+    during the first two steps, or when method doesn't calculate log-likelihood.
+    Reported log-likelihood is one of x1 or x', whichever step is accepted.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._log_likelihood: float | None = None
+
+    @property
+    def log_likelihood(self) -> float | None:
+        return self._log_likelihood
+
+    @staticmethod
+    def _params_mask(state: MixtureState) -> np.ndarray:
+        """Mask of params matrix elements, which are params of active distributions"""
+
+        return state.alive[:, np.newaxis] & (
+            np.arange(state.params.shape[1]) < state.sizes[:, np.newaxis]
+        )
+
+    @staticmethod
+    def _vector(state: MixtureState) -> np.ndarray:
+        """Params and logarithms of prior probabilities of active distributions"""
+
+        with np.errstate(divide="ignore"):
+            log_priors = np.log(state.priors[state.alive])
+        return np.concatenate(
+            [state.params[AcceleratedEM._params_mask(state)], log_priors]
+        )
+
+    @staticmethod
+    def _from_vector(state: MixtureState, vector: np.ndarray) -> MixtureState:
+        """Creates copy of state with params and prior probabilities from vector"""
+
+        # Fresh copy has no cached mixtures, so arrays can be written directly
+        new_state = state.copy()
+        mask = AcceleratedEM._params_mask(new_state)
+        params_count = np.count_nonzero(mask)
+        new_state.params[mask] = vector[:params_count]
+        log_priors = vector[params_count:]
+        new_state.priors[new_state.alive] = np.exp(log_priors - np.max(log_priors))
+        new_state.normalize()
+        return new_state
+
+    def update_state(
+        self, step: int, samples: Samples, state: MixtureState
+    ) -> ResultWithError[MixtureState]:
+        # pylint: disable=too-many-return-statements
+
+        self._log_likelihood = None
+        first = super().update_state(step, samples, state.copy())
+        self._log_likelihood = self.method.log_likelihood
+        if first.error:
+            return first
+        second = super().update_state(step, samples, first.content.copy())
+        ll = self.method.log_likelihood
+        self._log_likelihood = ll
+        if second.error or ll is None:
+            return second
+
+        states = (state, first.content, second.content)
+        if not np.array_equal(state.alive, first.content.alive) or not np.array_equal(
+            state.alive, second.content.alive
+        ):
+            return second
+
+        x0, x1, x2 = (self._vector(s) for s in states)
+        r = x1 - x0
+        v = x2 - x1 - r
+        v_norm = np.linalg.norm(v)
+        if v_norm == 0.0:
+            return second
+
+        alpha = min(-np.linalg.norm(r) / v_norm, -1.0)
+        x = x0 - 2 * alpha * r + alpha**2 * v
+        if not np.all(np.isfinite(x)):
+            return second
+
+        third = super().update_state(step, samples, self._from_vector(state, x))
+        extrapolated_ll = self.method.log_likelihood
+        if third.error or extrapolated_ll is None or extrapolated_ll < ll:
+            return second
+        self._log_likelihood = extrapolated_ll
+        return third
@@ -0,0 +1,257 @@
+"""
+Module which represents EM algorithm, which solves many problems
+with the same models layout at once
+"""
+
+import numpy as np
+from scipy.special import logsumexp
+
+from mpest.em.methods.likelihood_method import maximize_weighted_likelihood
+from mpest.exceptions import SampleError
+from mpest.mixture_distribution import DistributionInMixture, MixtureDistribution
+from mpest.models import AModel, AModelWithSufficientStatistics
+from mpest.optimizers import TOptimizer
+from mpest.problem import ASolver, Problem, Result
+from mpest.utils import ResultWithError
+
+
+class BatchEM(ASolver):
+    """
+    Class which represents EM algorithm with likelihood method,
+    which solves many problems with the same models layout in lockstep.
+
+    E and M steps are performed for all problems at once on stacked arrays,
+    samples of different sizes are padded and masked.
+    Distributions of models with sufficient statistics are updated in closed form,
+    others are updated by optimizer for each problem separately.
+
+    Each problem stops independently, when relative change of it's log-likelihood
+    is less than tolerance, or when max step is reached.
+    Degenerated distributions are detected in the same way as
+    FiniteChecker and PriorProbabilityThresholdChecker do.
+    """
+
+    def __init__(
+        self,
+        max_step: int = 16,
+        tolerance: float = 1e-6,
+        optimizer: TOptimizer | None = None,
+        prior_probability_threshold: float | None = 0.0001,
+        prior_probability_threshold_step: int | None = 3,
+    ) -> None:
+        """
+        Object constructor
+
+        :param max_step: Max count of EM steps
+        :param tolerance: Relative change of log-likelihood, which stops solving
+        :param optimizer: The optimizer, which is used for models
+        without sufficient statistics
+        :param prior_probability_threshold: Distributions with lower prior probability
+        are considered as degenerated
+        :param prior_probability_threshold_step: Step from which
+        prior probability threshold is checked
+        """
+
+        self.max_step = max_step
+        self.tolerance = tolerance
+        self.optimizer = optimizer
+        self.prior_probability_threshold = prior_probability_threshold
+        self.prior_probability_threshold_step = prior_probability_threshold_step
+
+    @staticmethod
+    def _lpdf(model: AModel, samples: np.ndarray, params: np.ndarray) -> np.ndarray:
+        """
+        Logarithms of pdf of samples matrix with params matrix,
+        row b of params corresponds to row b of samples.
+        Rows are calculated one by one, if model doesn't broadcast params.
+        """
+
+        if model.params_broadcasting:
+            return model.lpdf_samples(samples, params.T[..., np.newaxis])
+        return np.array([model.lpdf_samples(x, p) for x, p in zip(samples, params)])
+
+    def solve(self, problem: Problem, normalize: bool = True) -> Result:
+        """
+        Solve one problem with EM algorithm
+
+        :param problem: Problem with your mixture with initial parameters
+
+        :param normalize: Normalize parameters inside EM algo.
+        Default is True which means to normalize params, False if you don't want to normalize
+        """
+
+        return self.solve_batch([problem], normalize)[0]
+
+    def solve_batch(
+        self, problems: list[Problem], normalize: bool = True
+    ) -> list[Result]:
+        """
+        Solve problems with the same models layout with EM algorithm
+
+        :param problems: Problems with your mixtures with initial parameters.
+        Mixtures must have the same models in the same order.
+
+        :param normalize: Normalize parameters inside EM algo.
+        Default is True which means to normalize params, False if you don't want to normalize
+
+        :return: Results in the same order as problems
+        """
+
+        # pylint: disable=too-many-statements
+        # pylint: disable=too-many-branches
+
+        if not problems:
+            return []
+
+        models = [d.model for d in problems[0].distributions]
+        for problem in problems:
+            if [d.model.name for d in problem.distributions] != [
+                model.name for model in models
+            ]:
+                raise ValueError("Mixtures of all problems must have the same models")
+
+        if self.optimizer is None and not all(
+            isinstance(model, AModelWithSufficientStatistics) for model in models
+        ):
+            raise ValueError(
+                "Optimizer is needed for models without sufficient statistics"
+            )
+
+        k, b = len(models), len(problems)
+        sizes = np.array([len(problem.samples) for problem in problems])
+
+        # x[i] contains samples of problem i padded by zeros
+        x = np.zeros([b, max(sizes)])
+        mask = np.arange(max(sizes)) < sizes[:, np.newaxis]
+        for i, problem in enumerate(problems):
+            x[i, : sizes[i]] = problem.samples
+
+        # params[j][i] contains params of distribution j of problem i
+        params = [
+            np.array(
+                [
+                    d.model.params_convert_to_model(d.params) if normalize else d.params
+                    for d in (problem.distributions[j] for problem in problems)
+                ],
+                dtype=float,
+            )
+            for j in range(k)
+        ]
+        priors = np.array(
+            [
+                [problem.distributions[j].prior_probability for problem in problems]
+                for j in range(k)
+            ],
+            dtype=float,
+        )
+        alive = np.isfinite(priors)
+        priors = np.where(alive, priors, 0.0)
+
+        # Samples of each problem are shifted by their mean,
+        # so sums of statistics of samples far from zero stay accurate
+        shift = np.sum(x, axis=1) / np.maximum(sizes, 1)
+        statistics = [
+            model.sufficient_statistics(x, shift[:, np.newaxis])
+            if isinstance(model, AModelWithSufficientStatistics)
+            else None
+            for model in models
+        ]
+
+        running = np.ones(b, dtype=bool)
+        errors: list[Exception | None] = [None] * b
+        previous_ll = np.full(b, np.nan)
+
+        for step in range(self.max_step):
+            if not np.any(running):
+                break
+
+            # E step
+            with np.errstate(divide="ignore", invalid="ignore"):
+                lp = np.array(
+                    [self._lpdf(model, x, params[j]) for j, model in enumerate(models)]
+                )
+                lp = np.where(mask & alive[:, :, np.newaxis], lp, -np.inf)
+                active = np.any(lp > -np.inf, axis=0)
+
+                lwp = np.log(priors)[:, :, np.newaxis] + lp
+                lswp = logsumexp(lwp, axis=0)
+                h = np.where(active, np.exp(lwp - lswp), 0.0)
+
+            no_samples = running & ~np.any(active, axis=1)
+            zero_division = running & np.any(active & (lswp == -np.inf), axis=1)
+            for i in np.flatnonzero(no_samples | zero_division):
+                errors[i] = (
+                    SampleError(
+                        "None of the elements in the sample is correct for this mixture"
+                    )
+                    if no_samples[i]
+                    else ZeroDivisionError()
+                )
+            running &= ~(no_samples | zero_division)
+
+            ll = np.sum(np.where(active, lswp, 0.0), axis=1)
+            converged = np.abs(ll - previous_ll) <= self.tolerance * np.abs(ll)
+            running &= ~converged
+            previous_ll = ll
+
+            if not np.any(running):
+                break
+
+            # M step
+            m = np.count_nonzero(active, axis=1)
+            weights = np.sum(h, axis=2)
+            for j, model in enumerate(models):
+                updated = running & alive[j]
+                if statistics[j] is not None:
+                    new_params = model.params_from_statistics(
+                        np.sum(statistics[j] * h[j], axis=-1), weights[j], shift
+                    ).T
+                    params[j][updated] = new_params[updated]
+                    continue
+                for i in np.flatnonzero(updated):
+                    params[j][i] = maximize_weighted_likelihood(
+                        model,
+                        x[i][active[i]],
+                        h[j][i][active[i]],
+                        params[j][i],
+                        self.optimizer,
+                    )
+            priors[:, running] = (weights / np.maximum(m, 1))[:, running]
+
+            # Checking distributions
+            dead = ~np.isfinite(priors) | np.array(
+                [~np.all(np.isfinite(p), axis=1) for p in params]
+            )
+            if self.prior_probability_threshold is not None and (
+                self.prior_probability_threshold_step is None
+                or step >= self.prior_probability_threshold_step
+            ):
+                dead |= priors < self.prior_probability_threshold
+            alive[:, running] &= ~dead[:, running]
+            priors = np.where(alive, priors, 0.0)
+            priors_sums = np.sum(priors, axis=0)
+            priors = priors / np.where(priors_sums > 0, priors_sums, 1.0)
+
+            failed = running & ~np.any(alive, axis=0)
+            for i in np.flatnonzero(failed):
+                errors[i] = Exception("All distributions failed")
+            running &= ~failed
+
+        results = []
+        for i in range(b):
+            distributions = []
+            for j, model in enumerate(models):
+                p = params[j][i]
+                distributions.append(
+                    DistributionInMixture(
+                        model,
+                        model.params_convert_from_model(p) if normalize else p,
+                        priors[j, i] if alive[j, i] else None,
+                    )
+                )
+            results.append(
+                ResultWithError(
+                    MixtureDistribution(distributions, normalize=False), errors[i]
+                )
+            )
+        return results
@@ -1,5 +1,6 @@
 """Module which contains breakpointers for EM solver"""
 
+from mpest.em.breakpointers.log_likelihood_breakpointer import LogLikelihoodBreakpointer
 from mpest.em.breakpointers.param_differ_breakpointer import ParamDifferBreakpointer
 from mpest.em.breakpointers.step_count_breakpointer import StepCountBreakpointer
 from mpest.em.breakpointers.unionable_breakpointer import (
@@ -0,0 +1,74 @@
+"""Module which contains EM breakpointer by change of log-likelihood"""
+
+from mpest.em.breakpointers.unionable_breakpointer import AUnionableBreakpointer
+from mpest.mixture_distribution import MixtureDistribution
+
+
+class LogLikelihoodBreakpointer(AUnionableBreakpointer):
+    """
+    Class which represents EM breakpointer by change of log-likelihood.
+
+    Uses log-likelihood, which was calculated by E step,
+    so it works only with methods, which E steps calculate it.
+    Solving stops, when change of log-likelihood is less than
+    atol + rtol * |log-likelihood| for patience steps in a row.
+    """
+
+    def __init__(
+        self, rtol: float = 1e-6, atol: float = 0.0, patience: int = 1
+    ) -> None:
+        self._rtol = rtol
+        self._atol = atol
+        self._patience = patience
+
+        self._log_likelihood: float | None = None
+        self._stalls = 0
+
+    @property
+    def rtol(self):
+        """Relative tolerance getter"""
+        return self._rtol
+
+    @property
+    def atol(self):
+        """Absolute tolerance getter"""
+        return self._atol
+
+    @property
+    def patience(self):
+        """Patience getter"""
+        return self._patience
+
+    @property
+    def name(self):
+        return (
+            "LogLikelihoodBreakpointer("
+            + f"rtol={self.rtol}, "
+            + f"atol={self.atol}, "
+            + f"patience={self.patience}"
+            + ")"
+        )
+
+    def update_log_likelihood(self, step: int, log_likelihood: float | None) -> None:
+        if log_likelihood is None:
+            return
+
+        if self._log_likelihood is not None and abs(
+            log_likelihood - self._log_likelihood
+        ) <= self.atol + self.rtol * abs(log_likelihood):
+            self._stalls += 1
+        else:
+            self._stalls = 0
+        self._log_likelihood = log_likelihood
+
+    def is_over(
+        self,
+        step: int,
+        previous_step: MixtureDistribution | None,
+        current_step: MixtureDistribution,
+    ) -> bool:
+        if step == 0:
+            self._log_likelihood = None
+            self._stalls = 0
+            return False
+        return self._stalls >= self.patience
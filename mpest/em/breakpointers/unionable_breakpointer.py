@@ -50,6 +50,10 @@ class UnionBreakpointer(EM.ABreakpointer):
                 return True
         return False
 
+    def update_log_likelihood(self, step: int, log_likelihood: float | None) -> None:
+        for breakpointer in self._breakpointers:
+            breakpointer.update_log_likelihood(step, log_likelihood)
+
 
 class AUnionableBreakpointer(EM.ABreakpointer, ABC):
     """Abstract class which can be used to make any EM breakpointer unionable"""
@@ -5,12 +5,12 @@ Module which represents EM algorithm and few of it's params:
 """
 
 from abc import ABC, abstractmethod
-from typing import Callable
 
-from mpest.distribution import Distribution
 from mpest.em.methods.method import Method
+from mpest.em.mixture_state import MixtureState
 from mpest.mixture_distribution import DistributionInMixture, MixtureDistribution
 from mpest.problem import ASolver, Problem, Result
+from mpest.types import Samples
 from mpest.utils import (
     ANamed,
     ObjectWrapper,
@@ -36,6 +36,14 @@ class EM(ASolver):
         ) -> bool:
             """Breakpointer function"""
 
+        def update_log_likelihood(
+            self, step: int, log_likelihood: float | None
+        ) -> None:
+            """
+            Receives log-likelihood of samples for mixture of the step with given number,
+            which was calculated by E step. Does nothing by default.
+            """
+
     class ADistributionChecker(ANamed, ABC):
         """
         Abstract class which represents distribution checker function handler.
@@ -53,91 +61,6 @@ class EM(ASolver):
             which returns True if distribution is correct and not degenerated
             """
 
-    class _DistributionMixtureAlive(MixtureDistribution):
-        """
-        Class which represents mixture distribution which in EM algorithm solving process.
-        Remembers the distributions order and control over the degenerated ones.
-        """
-
-        def __init__(
-            self,
-            distributions: list[DistributionInMixture],
-            distribution_alive: Callable[[DistributionInMixture], bool] | None = None,
-        ) -> None:
-            super().__init__(distributions)
-
-            self._checker: Callable[[DistributionInMixture], bool] = (
-                distribution_alive if distribution_alive else lambda _: True
-            )
-
-            self._active_indexes = list(range(len(self._distributions)))
-            self._active = self._distributions
-
-            if distribution_alive:
-                self.update(self)
-
-        @classmethod
-        def from_distributions(
-            cls,
-            distributions: list[Distribution],
-            prior_probabilities: list[float | None] | None = None,
-            distribution_alive: Callable[[DistributionInMixture], bool] | None = None,
-        ) -> "EM._DistributionMixtureAlive":
-            return cls(
-                list(
-                    MixtureDistribution.from_distributions(
-                        distributions,
-                        prior_probabilities,
-                    )
-                ),
-                distribution_alive,
-            )
-
-        @property
-        def distributions(self) -> list[DistributionInMixture]:
-            """Active (non degenerated) distributions getter"""
-            return self._active
-
-        @property
-        def all_distributions(self) -> MixtureDistribution:
-            """All distributions getter"""
-            return MixtureDistribution(self._distributions)
-
-        def update(
-            self,
-            mixture_distribution: MixtureDistribution,
-            distribution_checker: Callable[[DistributionInMixture], bool] | None = None,
-        ):
-            """
-            Updating active distributions by given one.
-            Applies distribution checker function to active distributions.
-            Removes degenerated ones from active and sets their prior probabilities to None.
-            """
-
-            if distribution_checker is not None:
-                self._checker = distribution_checker
-
-            if len(mixture_distribution) != len(self._active):
-                raise ValueError(
-                    "New mixture distribution size must be the same with previous"
-                )
-
-            new_active_indexes: list[int] = []
-            for ind, d in zip(self._active_indexes, mixture_distribution):
-                if self._checker(d):
-                    new_active_indexes.append(ind)
-                    self._distributions[ind] = d
-                else:
-                    self._distributions[ind] = DistributionInMixture(
-                        d.model,
-                        d.params,
-                        None,
-                    )
-
-            self._normalize()
-            self._active_indexes = new_active_indexes
-            self._active = [self._distributions[ind] for ind in new_active_indexes]
-
     def __init__(
         self,
         breakpointer: "EM.ABreakpointer",
@@ -148,6 +71,15 @@ class EM(ASolver):
         self.distribution_checker = distribution_checker
         self.method = method
 
+    @property
+    def log_likelihood(self) -> float | None:
+        """
+        Log-likelihood of samples, which was calculated during the last full step,
+        or None if method doesn't calculate it
+        """
+
+        return self.method.log_likelihood
+
     class Log:
         """Class which represents EM algorithm log object"""
 
@@ -207,6 +139,28 @@ class EM(ASolver):
 
         return method.step(problem)
 
+    def update_state(
+        self, step: int, samples: Samples, state: MixtureState
+    ) -> ResultWithError[MixtureState]:
+        """
+        EM algorithm full step with checking distributions.
+        Given state can be modified, the new one is returned.
+        """
+
+        result = EM.step(Problem(samples, state.mixture), self.method)
+
+        if result.error:
+            return ResultWithError(state, result.error)
+
+        state.update(
+            result.content,
+            lambda d: self.distribution_checker.is_alive(step, d),
+        )
+
+        error = Exception("All distributions failed") if len(state) == 0 else None
+
+        return ResultWithError(state, error)
+
     def solve_logged(
         self,
         problem: Problem,
@@ -250,11 +204,8 @@ class EM(ASolver):
 
         history = []
 
-        def log_map(distributions: ResultWithError[EM._DistributionMixtureAlive]):
-            return ResultWithError(
-                distributions.content.all_distributions,
-                distributions.error,
-            )
+        def log_map(state: ResultWithError[MixtureState]):
+            return ResultWithError(state.content.all_mixture, state.error)
 
         @logged(
             history,
@@ -264,42 +215,26 @@ class EM(ASolver):
         )
         def make_step(
             step: int,
-            distributions: EM._DistributionMixtureAlive,
-        ) -> ResultWithError[EM._DistributionMixtureAlive]:
+            state: MixtureState,
+        ) -> ResultWithError[MixtureState]:
             """EM algorithm full step with checking distributions"""
 
-            new_problem = Problem(problem.samples, distributions)
-            result = EM.step(new_problem, self.method)
-
-            if result.error:
-                return ResultWithError(
-                    distributions,
-                    result.error,
-                )
-
-            distributions.update(
-                result.content,
-                lambda d: self.distribution_checker.is_alive(step, d),
-            )
-
-            error = (
-                Exception("All distributions failed")
-                if len(distributions) == 0
-                else None
-            )
-
-            return ResultWithError(distributions, error)
+            result = self.update_state(step, problem.samples, state)
+            self.breakpointer.update_log_likelihood(step, self.log_likelihood)
+            return result
 
         if normalize:
             problem = preprocess_problem(problem)
 
         previous_step = None
-        distributions = EM._DistributionMixtureAlive(list(problem.distributions))
+        state = MixtureState.from_mixture(problem.distributions)
         step = 0
 
-        while not self.breakpointer.is_over(step, previous_step, distributions):
-            previous_step = distributions.all_distributions
-            if make_step(step, distributions).content.error:
+        while not self.breakpointer.is_over(step, previous_step, state.mixture):
+            previous_step = state.all_mixture
+            result = make_step(step, state).content
+            state = result.content
+            if result.error:
                 break
             step += 1
 
@@ -309,7 +244,7 @@ class EM(ASolver):
         ]
 
         return ResultWithLog(
-            postprocess_result(ResultWithError(distributions.all_distributions)),
+            postprocess_result(ResultWithError(state.all_mixture)),
             EM.Log(history, step),
         )
 
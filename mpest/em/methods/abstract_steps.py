@@ -3,6 +3,8 @@
 from abc import ABC, abstractmethod
 from typing import Generic, TypeVar
 
+import numpy as np
+
 from mpest.mixture_distribution import MixtureDistribution
 from mpest.problem import Problem
 from mpest.utils import ResultWithError
@@ -15,6 +17,17 @@ class AExpectation(Generic[T], ABC):
     Abstract class which represents E step for EM
     """
 
+    _log_likelihood: float | None = None
+
+    @property
+    def log_likelihood(self) -> float | None:
+        """
+        Log-likelihood of samples for mixture of the last E step.
+        None if E step doesn't calculate it.
+        """
+
+        return self._log_likelihood
+
     @abstractmethod
     def step(self, problem: Problem) -> T:
         """
@@ -38,3 +51,86 @@ class AMaximization(Generic[T], ABC):
         :param e_result: Args, which got from e step. Depends on method
         :return: Object of class MixtureDistribution with new params of distributions
         """
+
+
+class MixtureStatistics:
+    """
+    Class which represents result of E step, which contains only sums of
+    sufficient statistics of samples, weighted by probabilities of samples
+    to be a part of each distribution.
+
+    It's size doesn't depend on samples count, so M step doesn't traverse samples.
+    Statistics of disjoint parts of samples (chunks, batches, shards)
+    are merged by addition, if they are calculated with the same shift of samples.
+    """
+
+    def __init__(
+        self,
+        weights: np.ndarray,
+        statistics: list[np.ndarray],
+        count: int,
+        log_likelihood: float,
+        problem: Problem,
+        shift: float = 0.0,
+    ) -> None:
+        """
+        Object constructor
+
+        :param weights: Sums of probabilities of samples for each distribution
+        :param statistics: Weighted sums of sufficient statistics for each distribution
+        :param count: Count of active samples
+        :param log_likelihood: Log-likelihood of active samples
+        :param problem: Problem, which was used in E step
+        :param shift: Shift of samples, which was used to calculate statistics
+        """
+
+        # pylint: disable=too-many-arguments
+
+        self._weights = weights
+        self._statistics = statistics
+        self._count = count
+        self._log_likelihood = log_likelihood
+        self._problem = problem
+        self._shift = shift
+
+    @property
+    def weights(self) -> np.ndarray:
+        """Sums of probabilities for each distribution getter"""
+        return self._weights
+
+    @property
+    def statistics(self) -> list[np.ndarray]:
+        """Weighted sums of sufficient statistics for each distribution getter"""
+        return self._statistics
+
+    @property
+    def count(self) -> int:
+        """Count of active samples getter"""
+        return self._count
+
+    @property
+    def log_likelihood(self) -> float:
+        """Log-likelihood of active samples getter"""
+        return self._log_likelihood
+
+    @property
+    def problem(self) -> Problem:
+        """Problem getter"""
+        return self._problem
+
+    @property
+    def shift(self) -> float:
+        """Shift of samples getter"""
+        return self._shift
+
+    def __add__(self, other: "MixtureStatistics") -> "MixtureStatistics":
+        if self.shift != other.shift:
+            raise ValueError("Statistics with different shifts can't be merged")
+        return MixtureStatistics(
+            self.weights + other.weights,
+            [s + o for s, o in zip(self.statistics, other.statistics)],
+            self.count + other.count,
+            self.log_likelihood + other.log_likelihood,
+            self.problem,
+            self.shift,
+        )
@@ -1,8 +1,5 @@
 """ The module in which the L moments method is presented """
 
-import json
-from math import ceil
-
 import numpy as np
 
 from mpest import Samples
@@ -11,7 +8,8 @@ from mpest.em.methods.abstract_steps import AExpectation, AMaximization
 from mpest.exceptions import EStepError, MStepError
 from mpest.mixture_distribution import MixtureDistribution
 from mpest.problem import Problem, Result
-from mpest.utils import ResultWithError, find_file
+from mpest.sample_sources import samples_array
+from mpest.utils import ResultWithError, binom
 
 EResult = tuple[Problem, list[float], np.ndarray] | ResultWithError[MixtureDistribution]
 
@@ -28,6 +26,35 @@ class IndicatorEStep(AExpectation[EResult]):
 
         self.indicators: np.ndarray
 
+        self._samples: Samples | None = None
+        self._order: np.ndarray | None = None
+        self._sorted_samples: Samples | None = None
+        self._log_likelihood: float | None = None
+
+    def sort_samples(self, samples: Samples) -> Samples:
+        """
+        A function that sorts samples.
+        Sort order is calculated once and reused, while the same samples are given.
+        Samples must not be changed in place, so given array is made read-only.
+
+        :param samples: Ndarray with samples or memory-mapped samples.
+        Other samples sources can't be sorted, they are rejected.
+        :return: Sorted samples
+        """
+
+        if samples is self._sorted_samples:
+            return samples
+
+        if samples is not self._samples:
+            array = samples_array(samples)
+            if isinstance(samples, np.ndarray):
+                samples.flags.writeable = False
+            self._samples = samples
+            self._order = np.argsort(array, kind="stable")
+            self._sorted_samples = array[self._order]
+
+        return self._sorted_samples
+
     def calc_indicators(self, problem: Problem) -> None:
         """
         A function that recalculates the matrix with indicators.
@@ -35,26 +62,20 @@ class IndicatorEStep(AExpectation[EResult]):
         :param problem: Object of class Problem, which contains samples and mixture.
         """
 
-        samples, mixture = np.sort(problem.samples), problem.distributions
+        samples, mixture = self.sort_samples(problem.samples), problem.distributions
+        self._log_likelihood = None
         priors = np.array([dist.prior_probability for dist in mixture])
-        k, m = len(mixture), len(samples)
 
-        z = np.zeros((k, m), dtype=float)
+        pdf_values = np.array([d.model.pdf_samples(samples, d.params) for d in mixture])
+        numerators = priors[:, np.newaxis] * pdf_values
 
-        pdf_values = np.zeros((k, m), dtype=float)
-        for j, d_j in enumerate(mixture):
-            pdf_values[j] = [d_j.model.pdf(samples[i], d_j.params) for i in range(m)]
-
-        denominators = np.sum(priors[:, np.newaxis] * pdf_values, axis=0)
+        denominators = np.sum(numerators, axis=0)
         if 0.0 in denominators:
             self.indicators = np.ndarray([])
             return None
 
-        for j in range(k):
-            numerators = priors[j] * pdf_values[j]
-            z[j] = numerators / denominators
-
-        self.indicators = z
+        self.indicators = numerators / denominators
+        self._log_likelihood = float(np.sum(np.log(denominators)))
         return None
 
     def update_priors(self, problem: Problem) -> list[float]:
@@ -65,14 +86,7 @@ class IndicatorEStep(AExpectation[EResult]):
         :return: List with prior probabilities
         """
 
-        k, m = len(problem.distributions), len(problem.samples)
-
-        new_priors = []
-        for j in range(k):
-            p_j = np.sum([self.indicators[j][i] for i in range(m)])
-            new_priors.append(p_j / m)
-
-        return new_priors
+        return list(np.sum(self.indicators, axis=1) / len(problem.samples))
 
     def step(self, problem: Problem) -> EResult:
         """
@@ -81,7 +95,9 @@ class IndicatorEStep(AExpectation[EResult]):
         :param problem: Object of class Problem, which contains samples and mixture.
         :return: Tuple with problem, new_priors and indicators.
         """
-        sorted_problem = Problem(np.sort(problem.samples), problem.distributions)
+        sorted_problem = Problem(
+            self.sort_samples(problem.samples), problem.distributions
+        )
 
         if (
             any(d.model.name == "Gaussian" for d in sorted_problem.distributions)
@@ -91,6 +107,7 @@ class IndicatorEStep(AExpectation[EResult]):
             self.indicators = distribute_numbers_transposed(
                 sorted_problem.samples, sorted_problem.distributions
             )
+            self._log_likelihood = None
         else:
             self.calc_indicators(sorted_problem)
 
@@ -116,9 +133,56 @@ class LMomentsMStep(AMaximization[EResult]):
     Class which calculate new params using matrix with indicator from E step.
     """
 
-    def __init__(self):
-        with open(find_file("binoms.json", "/"), "r", encoding="utf-8") as f:
-            self.binoms = json.load(f)
+    def calculate_pwms(
+        self, order: int, samples: Samples, indicators: np.ndarray
+    ) -> np.ndarray:
+        """
+        A function that calculates weighted probability weighted moments
+        b_0, ..., b_{order - 1} of each distribution.
+        Uses cumulative sums of indicators, so works in O(n) for each moment.
+
+        :param order: Count of probability weighted moments.
+        :param samples: Sorted ndarray with samples.
+        :param indicators: Matrix with indicators
+
+        :return: Matrix, which contains b_k of distribution j in [j, k] cell
+        """
+
+        ind_cumsums = np.round(np.cumsum(indicators, axis=1))
+        ind_sums = np.sum(indicators, axis=1)
+        weighted_samples = samples * indicators
+
+        pwms = np.zeros(shape=[len(indicators), order])
+        for k in range(order):
+            b_num = np.sum(
+                binom(ind_cumsums[:, k:], k) * weighted_samples[:, k:], axis=1
+            )
+            b_den = ind_sums * binom(np.ceil(ind_sums), k)
+            pwms[:, k] = b_num / b_den
+        return pwms
+
+    def calculate_l_moments(
+        self, order: int, samples: Samples, indicators: np.ndarray
+    ) -> np.ndarray:
+        """
+        A function that calculates L-moments l_1, ..., l_order of each distribution.
+
+        :param order: Count of L-moments.
+        :param samples: Sorted ndarray with samples.
+        :param indicators: Matrix with indicators
+
+        :return: Matrix, which contains l_r of distribution j in [j, r - 1] cell
+        """
+
+        # p_rk[r - 1, k] contains coefficient of b_k in l_r
+        p_rk = np.zeros(shape=[order, order])
+        for r in range(1, order + 1):
+            for k in range(r):
+                p_rk[r - 1, k] = (
+                    (-1) ** (r - k - 1) * binom(r - 1, k) * binom(r + k - 1, k)
+                )
+
+        return self.calculate_pwms(order, samples, indicators) @ p_rk.T
 
     def calculate_mr_j(
         self, r: int, j: int, samples: Samples, indicators: np.ndarray
@@ -134,30 +198,7 @@ class LMomentsMStep(AMaximization[EResult]):
         :return: lj_r L-moment
         """
 
-        n = len(samples)
-        binoms = self.binoms
-        mr_j = 0
-        for k in range(r):
-            b_num = np.sum(
-                [
-                    binoms[f"{round(np.sum(indicators[j][:i+1]))} {k}"]
-                    * samples[i]
-                    * indicators[j][i]
-                    for i in range(k, n)
-                ]
-            )
-
-            ind_sum = np.sum(indicators[j])
-            b_den = ind_sum * binoms[f"{ceil(ind_sum)} {k}"]
-            b_k = b_num / b_den
-            p_rk = (
-                (-1) ** (r - k - 1)
-                * binoms[f"{r - 1} {k}"]
-                * binoms[f"{r + k - 1} {k}"]
-            )
-
-            mr_j += p_rk * b_k
-        return mr_j
+        return self.calculate_l_moments(r, samples, indicators[j : j + 1])[0][r - 1]
 
     def step(self, e_result: EResult) -> Result:
         """
@@ -173,10 +214,9 @@ class LMomentsMStep(AMaximization[EResult]):
         samples, mixture = problem.samples, problem.distributions
 
         max_params_count = max(len(d.params) for d in mixture)
-        l_moments = np.zeros(shape=[len(mixture), max_params_count])
+        l_moments = self.calculate_l_moments(max_params_count, samples, indicators)
         for j, d in enumerate(mixture):
-            for r in range(len(d.params)):
-                l_moments[j][r] = self.calculate_mr_j(r + 1, j, samples, indicators)
+            l_moments[j][len(d.params) :] = 0.0
 
         for i, d in enumerate(mixture):
             if d.model.name == "WeibullExp" and (l_moments[i][0] * l_moments[i][1] < 0):
@@ -205,22 +245,14 @@ def distribute_numbers_transposed(numbers, mixture: MixtureDistribution):
 
     # TODO: To complete the heuristic approach
 
-    n = len(numbers)
-    m = len(mixture)
-
     gaussian_indices = [
         i for i, dist in enumerate(mixture) if dist.model.name == "Gaussian"
     ]
     gaussian_index = gaussian_indices[0]
 
-    result = np.zeros((m, n))
-
-    for i, num in enumerate(numbers):
-        if num < 0:
-            result[gaussian_index, i] = 1
-        else:
-            uniform_probability = 1 / len(mixture)
-            for j in range(len(mixture)):
-                result[j, i] = uniform_probability
+    negative = numbers < 0
+    result = np.full((len(mixture), len(numbers)), 1 / len(mixture))
+    result[:, negative] = 0.0
+    result[gaussian_index, negative] = 1.0
 
     return result
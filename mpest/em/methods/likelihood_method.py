@@ -1,19 +1,34 @@
 """ The module in which the maximum likelihood method is presented """
 
-from functools import partial
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 
 import numpy as np
+from scipy.special import logsumexp
 
 from mpest.distribution import Distribution
-from mpest.em.methods.abstract_steps import AExpectation, AMaximization
+from mpest.em.methods.abstract_steps import (
+    AExpectation,
+    AMaximization,
+    MixtureStatistics,
+)
 from mpest.exceptions import SampleError
 from mpest.mixture_distribution import MixtureDistribution
-from mpest.models import AModel, AModelDifferentiable
+from mpest.models import AModel, AModelDifferentiable, AModelWithSufficientStatistics
 from mpest.optimizers import AOptimizerJacobian, TOptimizer
 from mpest.problem import Problem, Result
+from mpest.sample_sources import samples_array
+from mpest.types import Params, Samples
 from mpest.utils import ResultWithError
 
-EResult = tuple[list[float], np.ndarray, Problem] | ResultWithError[MixtureDistribution]
+# Count of first samples, which mean is used as shift of samples
+SHIFT_SAMPLES_COUNT = 1024
+
+EResult = (
+    tuple[Samples, np.ndarray, Problem]
+    | MixtureStatistics
+    | ResultWithError[MixtureDistribution]
+)
 
 
 class BayesEStep(AExpectation[EResult]):
@@ -21,46 +36,197 @@ class BayesEStep(AExpectation[EResult]):
     Class which represents Bayesian method for calculating matrix for M step in likelihood method
     """
 
+    def __init__(self):
+        """
+        Object constructor
+        """
+
+        self._log_likelihood: float | None = None
+
     def step(self, problem: Problem) -> EResult:
         """
         A function that performs E step
 
         :param problem: Object of class Problem, which contains samples and mixture.
+        Samples can be array or memory-mapped samples,
+        other samples sources are processed by ChunkedBayesEStep.
         :return: Return active_samples, matrix with probabilities and problem.
         """
-        samples = problem.samples
+        samples = samples_array(problem.samples)
         mixture = problem.distributions
-        p_xij = []
-        active_samples = []
-        for x in samples:
-            p = np.array([d.model.pdf(x, d.params) for d in mixture])
-            if np.any(p):
-                p_xij.append(p)
-                active_samples.append(x)
-
-        if not active_samples:
+        self._log_likelihood = None
+
+        # lp[j, i] contains logarithm of pdf of distribution j in X_i
+        lp = np.array([d.model.lpdf_samples(samples, d.params) for d in mixture])
+        active = np.any(lp > -np.inf, axis=0)
+
+        if not np.any(active):
             error = SampleError(
                 "None of the elements in the sample is correct for this mixture"
             )
             return ResultWithError(mixture, error)
 
-        # h[j, i] contains probability of X_i to be a part of distribution j
-        m = len(p_xij)
-        k = len(mixture)
-        h = np.zeros([k, m], dtype=float)
-        curr_w = np.array([d.prior_probability for d in mixture])
-        for i, p in enumerate(p_xij):
-            wp = curr_w * p
-            swp = np.sum(wp)
+        active_samples = samples[active]
+        with np.errstate(divide="ignore"):
+            curr_lw = np.log([d.prior_probability for d in mixture])
+        lwp = curr_lw[:, np.newaxis] + lp[:, active]
+        lswp = logsumexp(lwp, axis=0)
 
-            if not swp:
-                return ResultWithError(mixture, ZeroDivisionError())
+        if np.any(lswp == -np.inf):
+            return ResultWithError(mixture, ZeroDivisionError())
 
-            h[:, i] = wp / swp
+        self._log_likelihood = float(np.sum(lswp))
+
+        # h[j, i] contains probability of X_i to be a part of distribution j
+        h = np.exp(lwp - lswp)
 
         return active_samples, h, problem
 
 
+class ChunkedBayesEStep(AExpectation[EResult]):
+    """
+    Class which represents Bayesian method for calculating sufficient statistics
+    for M step in likelihood method by chunks of samples.
+
+    Matrix with probabilities isn't materialized, only weighted sums of
+    sufficient statistics are accumulated, so memory usage is bounded by
+    memory budget and samples can be given by samples source.
+    All models must have sufficient statistics.
+
+    Samples are shifted by the same value for all chunks before calculating
+    sufficient statistics, so sums of statistics of samples far from zero
+    stay accurate.
+    """
+
+    def __init__(
+        self, memory_budget: int | None = 64 * 2**20, shift: float | None = None
+    ):
+        """
+        Object constructor
+
+        :param memory_budget: Approximate memory in bytes,
+        which can be used for arrays of one chunk.
+        None means that all samples are processed in a single chunk.
+        :param shift: Shift of samples for sufficient statistics.
+        None means that mean of first samples of problem is used.
+        """
+
+        self.memory_budget = memory_budget
+        self.shift = shift
+
+        self._log_likelihood: float | None = None
+
+    def chunk_size(self, problem: Problem) -> int:
+        """
+        Chunk size, which fits into memory budget.
+        Each sample of chunk needs few float values for every distribution
+        and for every it's sufficient statistic.
+        """
+
+        if self.memory_budget is None:
+            return max(1, len(problem.samples))
+
+        statistics_count = max(
+            (d.model.statistics_count for d in problem.distributions), default=0
+        )
+        sample_size = 8 * (4 * len(problem.distributions) + 2 * statistics_count + 2)
+        return max(1, self.memory_budget // sample_size)
+
+    @staticmethod
+    def check_models(mixture: MixtureDistribution) -> None:
+        """Checks that all models of mixture have sufficient statistics"""
+
+        for d in mixture:
+            if not isinstance(d.model, AModelWithSufficientStatistics):
+                raise TypeError(f"Model {d.model.name} hasn't sufficient statistics")
+
+    def statistics_shift(self, problem: Problem) -> float:
+        """
+        Shift of samples for sufficient statistics, which is used for all chunks.
+        Mean of first samples of problem is used, if shift isn't given.
+        """
+
+        if self.shift is not None:
+            return self.shift
+
+        first = next(problem.chunks(SHIFT_SAMPLES_COUNT), np.empty(0))
+        first = np.asarray(first)[np.isfinite(first)]
+        return float(np.mean(first)) if len(first) > 0 else 0.0
+
+    @staticmethod
+    def chunk_statistics(
+        chunk: Samples, problem: Problem, shift: float = 0.0
+    ) -> MixtureStatistics | ResultWithError[MixtureDistribution]:
+        """
+        Calculates sufficient statistics of chunk of samples in a single pass
+
+        :param chunk: Chunk of samples
+        :param problem: Object of class Problem, which contains mixture.
+        :param shift: Shift of samples for sufficient statistics
+        """
+
+        mixture = problem.distributions
+        with np.errstate(divide="ignore"):
+            curr_lw = np.log([d.prior_probability for d in mixture])
+
+        lp = np.array([d.model.lpdf_samples(chunk, d.params) for d in mixture])
+        active = np.any(lp > -np.inf, axis=0)
+
+        lwp = curr_lw[:, np.newaxis] + lp[:, active]
+        lswp = logsumexp(lwp, axis=0)
+        if np.any(lswp == -np.inf):
+            return ResultWithError(mixture, ZeroDivisionError())
+
+        # h[j, i] contains probability of active X_i to be a part of distribution j
+        h = np.exp(lwp - lswp)
+        active_chunk = chunk[active]
+
+        return MixtureStatistics(
+            np.sum(h, axis=1),
+            [
+                d.model.sufficient_statistics(active_chunk, shift) @ ch
+                for d, ch in zip(mixture, h)
+            ],
+            len(active_chunk),
+            float(np.sum(lswp)),
+            problem,
+            shift,
+        )
+
+    def step(self, problem: Problem) -> EResult:
+        """
+        A function that performs E step
+
+        :param problem: Object of class Problem, which contains samples and mixture.
+        :return: Return sums of sufficient statistics weighted by probabilities.
+        """
+
+        mixture = problem.distributions
+        self._log_likelihood = None
+        self.check_models(mixture)
+
+        shift = self.statistics_shift(problem)
+        statistics: MixtureStatistics | None = None
+        for chunk in problem.chunks(self.chunk_size(problem)):
+            chunk_statistics = self.chunk_statistics(chunk, problem, shift)
+            if isinstance(chunk_statistics, ResultWithError):
+                return chunk_statistics
+            statistics = (
+                chunk_statistics
+                if statistics is None
+                else statistics + chunk_statistics
+            )
+
+        if statistics is None or statistics.count == 0:
+            error = SampleError(
+                "None of the elements in the sample is correct for this mixture"
+            )
+            return ResultWithError(mixture, error)
+
+        self._log_likelihood = statistics.log_likelihood
+        return statistics
+
+
 class ML(AExpectation[EResult]):
     """
     Class which represents ML method for calculating matrix for M step in likelihood method
@@ -74,70 +240,217 @@ class ML(AExpectation[EResult]):
         """
 
 
+class WeightedLogLikelihood:
+    """
+    Class which represents negative weighted logarithm of likelihood function of model.
+    Used as objective function for optimizers in M step of likelihood method.
+
+    Samples with zero weights are dropped once at construction,
+    so each call is a single vectorized expression over the rest of them.
+    """
+
+    def __init__(self, model: AModel, samples: Samples, weights: np.ndarray):
+        """
+        Object constructor
+
+        :param model: Model of distribution
+        :param samples: Samples
+        :param weights: Weights of samples
+        """
+
+        nonzero = weights > 0
+        self.model = model
+        self.samples = samples[nonzero]
+        self.weights = weights[nonzero]
+
+    def __call__(self, params: Params) -> float:
+        return -np.dot(self.weights, self.model.lpdf_samples(self.samples, params))
+
+    def jacobian(self, params: Params) -> np.ndarray:
+        """Jacobian of objective function, needs differentiable model"""
+
+        if not isinstance(self.model, AModelDifferentiable):
+            raise TypeError(f"Model {self.model} isn't differentiable")
+        return -(self.model.ld_params_samples(self.samples, params) @ self.weights)
+
+    def value_and_jacobian(self, params: Params) -> tuple[float, np.ndarray]:
+        """Objective function value and it's jacobian, calculated together"""
+
+        return self(params), self.jacobian(params)
+
+
+def maximize_weighted_likelihood(
+    model: AModel,
+    samples: Samples,
+    weights: np.ndarray,
+    params: Params,
+    optimizer: TOptimizer,
+    closed_form: bool = False,
+) -> Params:
+    """
+    Finds params of model, which maximize weighted logarithm of likelihood function
+
+    :param model: Model of distribution
+    :param samples: Samples
+    :param weights: Weights of samples
+    :param params: Initial params
+    :param optimizer: The optimizer that is used
+    :param closed_form: Find params of models with sufficient statistics in closed form
+    """
+
+    # pylint: disable=too-many-arguments
+
+    if closed_form and isinstance(model, AModelWithSufficientStatistics):
+        return model.weighted_mle(samples, weights)
+    if isinstance(optimizer, AOptimizerJacobian):
+        if not isinstance(model, AModelDifferentiable):
+            raise TypeError(f"Model {model} isn't differentiable")
+        return optimizer.minimize_fused(
+            WeightedLogLikelihood(model, samples, weights).value_and_jacobian,
+            params,
+        )
+    return optimizer.minimize(
+        func=WeightedLogLikelihood(model, samples, weights),
+        params=params,
+    )
+
+
 class LikelihoodMStep(AMaximization[EResult]):
     """
     Class which calculate new params using logarithm od likelihood function
 
+    Distributions are independent given matrix with probabilities,
+    so they can be maximized in parallel by pool of workers.
+    Thread pool suits objectives, which spend time in NumPy,
+    process pool suits pure-Python objectives.
+    Pool of workers is released by close method or at the end of with block.
+    Pool, which isn't released, is shut down without waiting,
+    when the step is garbage collected.
+
     :param optimizer: The optimizer that is used in the step
+    :param closed_form: Find params of models with sufficient statistics in closed form
     """
 
-    def __init__(self, optimizer: TOptimizer):
+    def __init__(
+        self,
+        optimizer: TOptimizer,
+        closed_form: bool = False,
+        workers: int = 1,
+        processes: bool = False,
+    ):
         """
         Object constructor
 
         :param optimizer: The optimizer that is used in the step
+        :param closed_form: Find params of models with sufficient statistics
+        in closed form instead of using optimizer.
+        Default is False which means to use optimizer for all models
+        :param workers: Count of workers, which maximize distributions in parallel.
+        Default is 1 which means to maximize distributions one after another
+        :param processes: Use process pool instead of thread pool
         """
         self.optimizer = optimizer
+        self.closed_form = closed_form
+        self.workers = workers
+        self.processes = processes
+
+        self._executor: Executor | None = None
+        self._finalizer: weakref.finalize | None = None
+
+    def __getstate__(self):
+        # Pool of workers isn't copied, new one is created when needed
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        state["_finalizer"] = None
+        return state
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def executor(self) -> Executor:
+        """Pool of workers getter, pool is created on first use"""
+
+        if self._executor is None:
+            if self.processes:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers)
+            self._finalizer = weakref.finalize(
+                self, self._executor.shutdown, wait=False
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """Shuts down pool of workers"""
+
+        if self._finalizer is not None:
+            self._finalizer.detach()
+            self._finalizer = None
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
 
     def step(self, e_result: EResult) -> Result:
         """
         A function that performs E step
 
         :param e_result: A tuple containing the arguments obtained from step E:
-        active_samples, matrix with probabilities and problem.
+        active_samples, matrix with probabilities and problem,
+        or sums of sufficient statistics.
         """
 
         if isinstance(e_result, ResultWithError):
             return e_result
 
+        if isinstance(e_result, MixtureStatistics):
+            return self.statistics_step(e_result)
+
         samples, h, problem = e_result
-        optimizer = self.optimizer
 
         m = len(h[0])
         mixture = problem.distributions
 
         new_w = np.sum(h, axis=1) / m
-        new_distributions: list[Distribution] = []
-        for j, ch in enumerate(h[:]):
-            d = mixture[j]
-
-            def log_likelihood(params, ch, model: AModel):
-                return -np.sum(ch * [model.lpdf(x, params) for x in samples])
-
-            def jacobian(params, ch, model: AModelDifferentiable):
-                return -np.sum(
-                    ch
-                    * np.swapaxes([model.ld_params(x, params) for x in samples], 0, 1),
-                    axis=1,
-                )
-
-            # maximizing log of likelihood function for every active distribution
-            if isinstance(optimizer, AOptimizerJacobian):
-                if not isinstance(d.model, AModelDifferentiable):
-                    raise TypeError
-
-                new_params = optimizer.minimize(
-                    partial(log_likelihood, ch=ch, model=d.model),
-                    d.params,
-                    jacobian=partial(jacobian, ch=ch, model=d.model),
-                )
-            else:
-                new_params = optimizer.minimize(
-                    func=partial(log_likelihood, ch=ch, model=d.model),
-                    params=d.params,
-                )
 
-            new_distributions.append(Distribution(d.model, new_params))
+        # maximizing log of likelihood function for every active distribution
+        args = [
+            (d.model, samples, ch, d.params, self.optimizer, self.closed_form)
+            for d, ch in zip(mixture, h)
+        ]
+        if self.workers > 1 and len(args) > 1:
+            new_params = list(
+                self.executor.map(maximize_weighted_likelihood, *zip(*args))
+            )
+        else:
+            new_params = [maximize_weighted_likelihood(*arg) for arg in args]
+
+        new_distributions = [
+            Distribution(d.model, params) for d, params in zip(mixture, new_params)
+        ]
         return ResultWithError(
             MixtureDistribution.from_distributions(new_distributions, new_w)
         )
+
+    @staticmethod
+    def statistics_step(e_result: MixtureStatistics) -> Result:
+        """
+        A function that performs M step in closed form by sums of sufficient statistics
+
+        :param e_result: Sums of sufficient statistics obtained from step E
+        """
+
+        new_distributions = [
+            Distribution(d.model, d.model.params_from_statistics(s, w, e_result.shift))
+            for d, s, w in zip(
+                e_result.problem.distributions, e_result.statistics, e_result.weights
+            )
+        ]
+        return ResultWithError(
+            MixtureDistribution.from_distributions(
+                new_distributions, list(e_result.weights / e_result.count)
+            )
+        )
@@ -26,6 +26,15 @@ class Method(Generic[T]):
         self.e_step = e_step
         self.m_step = m_step
 
+    @property
+    def log_likelihood(self) -> float | None:
+        """
+        Log-likelihood of samples for mixture of the last step,
+        which was calculated by E step.
+        """
+
+        return self.e_step.log_likelihood
+
     def step(self, problem: Problem) -> ResultWithError[MixtureDistribution]:
         """
         Function that performs E and M steps
@@ -0,0 +1,256 @@
+"""
+Module which represents E step of likelihood method,
+which is performed by worker processes on shards of samples in shared memory
+"""
+
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from mpest.em.methods.abstract_steps import MixtureStatistics
+from mpest.em.methods.likelihood_method import ChunkedBayesEStep, EResult
+from mpest.exceptions import SampleError
+from mpest.mixture_distribution import DistributionInMixture, MixtureDistribution
+from mpest.models import AModel
+from mpest.problem import Problem
+from mpest.sample_sources import ASampleSource, attach_shared_samples, iterate_chunks
+from mpest.types import Samples
+from mpest.utils import ResultWithError
+
+MixtureArrays = tuple[tuple[AModel, ...], np.ndarray, np.ndarray, np.ndarray]
+
+
+def _mixture_to_arrays(mixture: MixtureDistribution) -> MixtureArrays:
+    """
+    Splits mixture into models, flat array of params of all distributions,
+    ends of params of every distribution in it and array of prior probabilities
+    """
+
+    params = [np.asarray(d.params, dtype=np.float64) for d in mixture]
+    return (
+        tuple(d.model for d in mixture),
+        np.concatenate(params) if params else np.empty(0),
+        np.cumsum([len(p) for p in params], dtype=int),
+        np.array([d.prior_probability for d in mixture], dtype=np.float64),
+    )
+
+
+def _mixture_from_arrays(arrays: MixtureArrays) -> MixtureDistribution:
+    """Creates mixture from arrays, which are made by _mixture_to_arrays"""
+
+    models, params, ends, priors = arrays
+    return MixtureDistribution(
+        [
+            DistributionInMixture(model, p, float(prior))
+            for model, p, prior in zip(models, np.split(params, ends[:-1]), priors)
+        ],
+        normalize=False,
+    )
+
+
+def _shard_statistics(
+    name: str,
+    size: int,
+    bounds: tuple[int, int],
+    arrays: MixtureArrays,
+    chunk_size: int,
+    shift: float,
+) -> tuple[np.ndarray, list[np.ndarray], int, float] | None:
+    """
+    Calculates sums of sufficient statistics of samples shard by chunks.
+    Returns None if probabilities of samples can't be calculated.
+    """
+
+    # pylint: disable=too-many-arguments
+
+    start, stop = bounds
+    shard = attach_shared_samples(name, size)[start:stop]
+    problem = Problem(shard, _mixture_from_arrays(arrays))
+
+    statistics: MixtureStatistics | None = None
+    for chunk in problem.chunks(chunk_size):
+        chunk_statistics = ChunkedBayesEStep.chunk_statistics(chunk, problem, shift)
+        if isinstance(chunk_statistics, ResultWithError):
+            return None
+        statistics = (
+            chunk_statistics if statistics is None else statistics + chunk_statistics
+        )
+
+    if statistics is None:
+        return None
+    return (
+        statistics.weights,
+        statistics.statistics,
+        statistics.count,
+        statistics.log_likelihood,
+    )
+
+
+def _release_shared_memory(shared_memory: SharedMemory) -> None:
+    """Closes and removes shared memory"""
+
+    shared_memory.close()
+    shared_memory.unlink()
+
+
+class ShardedBayesEStep(ChunkedBayesEStep):
+    """
+    Class which represents Bayesian method for calculating sufficient statistics
+    for M step in likelihood method by worker processes.
+
+    Samples are placed into shared memory once, samples are split into shards,
+    one shard for every worker. On each step only models and flat arrays
+    of params and prior probabilities of mixture are sent to workers,
+    which return sums of sufficient statistics of their shards.
+    Workers process shards by chunks, which fit into memory budget.
+    All models must have sufficient statistics.
+
+    Shared memory and workers are released by close method
+    or at the end of with block. Ones, which aren't released,
+    are released without waiting, when the step is garbage collected.
+    """
+
+    def __init__(
+        self, workers: int | None = None, memory_budget: int | None = 64 * 2**20
+    ):
+        """
+        Object constructor
+
+        :param workers: Count of worker processes, default is count of CPUs
+        :param memory_budget: Approximate memory in bytes,
+        which can be used by each worker for arrays of one chunk.
+        None means that each shard is processed in a single chunk.
+        """
+
+        super().__init__(memory_budget)
+        self.workers = workers or os.cpu_count() or 1
+
+        self._samples: Samples | ASampleSource | None = None
+        self._shared_memory: SharedMemory | None = None
+        self._executor: ProcessPoolExecutor | None = None
+        self._finalizers: dict[str, weakref.finalize] = {}
+
+    def __getstate__(self):
+        # Shared memory and workers aren't copied, new ones are created when needed
+        state = self.__dict__.copy()
+        state["_samples"] = None
+        state["_shared_memory"] = None
+        state["_executor"] = None
+        state["_finalizers"] = {}
+        return state
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _detach_finalizer(self, key: str) -> None:
+        """Detaches finalizer of released resource"""
+
+        finalizer = self._finalizers.pop(key, None)
+        if finalizer is not None:
+            finalizer.detach()
+
+    def _share(self, samples: Samples | ASampleSource) -> str:
+        """Places samples into shared memory, if they aren't there yet"""
+
+        if samples is not self._samples or self._shared_memory is None:
+            self._release_samples()
+
+            size = len(samples)
+            self._shared_memory = SharedMemory(create=True, size=max(1, size) * 8)
+            shared = np.ndarray(
+                (size,), dtype=np.float64, buffer=self._shared_memory.buf
+            )
+            start = 0
+            for chunk in iterate_chunks(samples):
+                shared[start : start + len(chunk)] = chunk
+                start += len(chunk)
+            del shared
+
+            self._samples = samples
+            self._finalizers["shared_memory"] = weakref.finalize(
+                self, _release_shared_memory, self._shared_memory
+            )
+
+        return self._shared_memory.name
+
+    def _release_samples(self) -> None:
+        """Releases shared memory"""
+
+        self._detach_finalizer("shared_memory")
+        if self._shared_memory is not None:
+            _release_shared_memory(self._shared_memory)
+            self._shared_memory = None
+        self._samples = None
+
+    def close(self) -> None:
+        """Shuts down workers and releases shared memory"""
+
+        self._detach_finalizer("executor")
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self._release_samples()
+
+    def step(self, problem: Problem) -> EResult:
+        """
+        A function that performs E step
+
+        :param problem: Object of class Problem, which contains samples and mixture.
+        :return: Return sums of sufficient statistics weighted by probabilities.
+        """
+
+        mixture = problem.distributions
+        self._log_likelihood = None
+        self.check_models(mixture)
+
+        name = self._share(problem.samples)
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            self._finalizers["executor"] = weakref.finalize(
+                self, self._executor.shutdown, wait=False
+            )
+
+        size = len(problem.samples)
+        shift = self.statistics_shift(problem)
+        arrays = _mixture_to_arrays(mixture)
+        bounds = np.linspace(0, size, self.workers + 1, dtype=int)
+        futures = [
+            self._executor.submit(
+                _shard_statistics,
+                name,
+                size,
+                (int(start), int(stop)),
+                arrays,
+                self.chunk_size(problem),
+                shift,
+            )
+            for start, stop in zip(bounds[:-1], bounds[1:])
+            if stop > start
+        ]
+
+        statistics: MixtureStatistics | None = None
+        for future in futures:
+            shard_statistics = future.result()
+            if shard_statistics is None:
+                return ResultWithError(mixture, ZeroDivisionError())
+            shard_statistics = MixtureStatistics(*shard_statistics, problem, shift)
+            statistics = (
+                shard_statistics
+                if statistics is None
+                else statistics + shard_statistics
+            )
+
+        if statistics is None or statistics.count == 0:
+            error = SampleError(
+                "None of the elements in the sample is correct for this mixture"
+            )
+            return ResultWithError(mixture, error)
+
+        self._log_likelihood = statistics.log_likelihood
+        return statistics
@@ -0,0 +1,113 @@
+"""Module that represents stochastic method class, which uses batches of samples"""
+
+from math import ceil
+
+import numpy as np
+
+from mpest.em.methods.abstract_steps import AExpectation, AMaximization
+from mpest.em.methods.method import Method, T
+from mpest.mixture_distribution import MixtureDistribution
+from mpest.problem import Problem
+from mpest.sample_sources import ASampleSource
+from mpest.utils import ResultWithError
+
+
+class StochasticMethod(Method[T]):
+    """
+    Class that performs E and M steps on random batches of samples.
+
+    Batch size grows geometrically from step to step,
+    after it reaches samples size (or after polishing step) all samples are used,
+    so the last steps are the same as steps of usual method.
+    Steps are counted from the first step with new samples or from reset.
+    Batches of samples sources are read by samples source take method.
+    Samples sources, which can be processed only by chunks,
+    need E step, which processes samples by chunks, e.g. ChunkedBayesEStep,
+    because all samples are used in the last steps.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        e_step: AExpectation[T],
+        m_step: AMaximization[T],
+        initial_batch_size: int = 1000,
+        batch_growth: float = 2.0,
+        polishing_step: int | None = None,
+        seed: int | None = None,
+    ):
+        """
+        Object constructor.
+
+        :param e_step: AExpectation object which performs E step
+        :param m_step: AMaximization object which performs M step
+        :param initial_batch_size: Batch size of the first step
+        :param batch_growth: Factor of batch size growth on each step
+        :param polishing_step: Step from which all samples are used
+        :param seed: Seed of batches generator
+        """
+
+        # pylint: disable=too-many-arguments
+
+        super().__init__(e_step, m_step)
+        self.initial_batch_size = initial_batch_size
+        self.batch_growth = batch_growth
+        self.polishing_step = polishing_step
+
+        self._rng = np.random.default_rng(seed)
+        self._samples = None
+        self._step = 0
+        self._batch_size = initial_batch_size
+        self._scale = 1.0
+
+    @property
+    def batch_size(self) -> int:
+        """Batch size of the next step getter"""
+        return self._batch_size
+
+    @property
+    def log_likelihood(self) -> float | None:
+        """
+        Log-likelihood of samples for mixture of the last step,
+        which was calculated by E step on batch and scaled to all samples.
+        """
+
+        log_likelihood = super().log_likelihood
+        return None if log_likelihood is None else log_likelihood * self._scale
+
+    def reset(self) -> None:
+        """Starts batch size schedule from the beginning"""
+
+        self._step = 0
+        self._batch_size = self.initial_batch_size
+
+    def step(self, problem: Problem) -> ResultWithError[MixtureDistribution]:
+        """
+        Function that performs E and M steps on batch of samples
+
+        :param problem: Object of Problem class which contains samples and mixture.
+        """
+
+        samples = problem.samples
+        if samples is not self._samples:
+            self._samples = samples
+            self.reset()
+
+        if self.polishing_step is not None and self._step >= self.polishing_step:
+            self._batch_size = len(samples)
+        self._batch_size = min(self._batch_size, len(samples))
+
+        if self._batch_size < len(samples):
+            indices = self._rng.choice(len(samples), self._batch_size, replace=False)
+            if isinstance(samples, ASampleSource):
+                batch = samples.take(indices)
+            else:
+                batch = samples[indices]
+            problem = Problem(batch, problem.distributions)
+        self._scale = len(samples) / len(problem.samples)
+
+        self._step += 1
+        self._batch_size = ceil(self._batch_size * self.batch_growth)
+
+        return super().step(problem)
@@ -0,0 +1,200 @@
+"""Module which represents mixture distribution state of EM algorithm solving process"""
+
+from typing import Callable
+
+import numpy as np
+
+from mpest.mixture_distribution import DistributionInMixture, MixtureDistribution
+from mpest.models import AModel
+
+
+class MixtureState:
+    """
+    Class which represents mixture distribution in EM algorithm solving process.
+
+    Stores mixture as arrays instead of distribution objects:
+    - params matrix, row j contains params of distribution j padded by NaN values
+    - prior probabilities vector, degenerated distributions have zero ones
+    - alive mask of non degenerated distributions
+    - model ids vector, which contains indexes of distributions models in models list,
+      one model of each type
+
+    Remembers the distributions order and control over the degenerated ones.
+    MixtureDistribution objects are created only when they are requested.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        models: list[AModel],
+        model_ids: np.ndarray,
+        params: np.ndarray,
+        sizes: np.ndarray,
+        priors: np.ndarray,
+        alive: np.ndarray,
+    ) -> None:
+        # pylint: disable=too-many-arguments
+        self._models = models
+        self._model_ids = model_ids
+        self._params = params
+        self._sizes = sizes
+        self._priors = priors
+        self._alive = alive
+
+        self._mixture: MixtureDistribution | None = None
+        self._all_mixture: MixtureDistribution | None = None
+
+    @classmethod
+    def from_mixture(cls, mixture: MixtureDistribution) -> "MixtureState":
+        """
+        Creates MixtureState object from mixture distribution.
+        Distributions with None prior probability are considered as degenerated.
+        """
+
+        # Models are grouped by type, not by name,
+        # so different models with the same name aren't mixed up
+        models: list[AModel] = []
+        model_indexes: dict[type[AModel], int] = {}
+        model_ids = np.zeros(len(mixture), dtype=int)
+        for j, d in enumerate(mixture):
+            if type(d.model) not in model_indexes:
+                model_indexes[type(d.model)] = len(models)
+                models.append(d.model)
+            model_ids[j] = model_indexes[type(d.model)]
+
+        sizes = np.array([len(d.params) for d in mixture], dtype=int)
+        params = np.full((len(mixture), max(sizes, default=0)), np.nan)
+        for j, d in enumerate(mixture):
+            params[j, : sizes[j]] = d.params
+
+        alive = np.array([d.prior_probability is not None for d in mixture])
+        priors = np.array(
+            [d.prior_probability if d.prior_probability else 0.0 for d in mixture],
+            dtype=float,
+        )
+
+        state = cls(models, model_ids, params, sizes, priors, alive)
+        state.normalize()
+        return state
+
+    @property
+    def models(self) -> list[AModel]:
+        """Models list getter"""
+        return self._models
+
+    @property
+    def model_ids(self) -> np.ndarray:
+        """Model ids vector getter"""
+        return self._model_ids
+
+    @property
+    def params(self) -> np.ndarray:
+        """Params matrix getter"""
+        return self._params
+
+    @property
+    def sizes(self) -> np.ndarray:
+        """Params counts vector getter"""
+        return self._sizes
+
+    @property
+    def priors(self) -> np.ndarray:
+        """Prior probabilities vector getter"""
+        return self._priors
+
+    @property
+    def alive(self) -> np.ndarray:
+        """Alive mask getter"""
+        return self._alive
+
+    def __len__(self):
+        return int(np.count_nonzero(self._alive))
+
+    def model(self, ind: int) -> AModel:
+        """Model of distribution with given index getter"""
+        return self._models[self._model_ids[ind]]
+
+    def distribution(self, ind: int) -> DistributionInMixture:
+        """Creates distribution with given index"""
+
+        return DistributionInMixture(
+            self.model(ind),
+            self._params[ind, : self._sizes[ind]].copy(),
+            self._priors[ind] if self._alive[ind] else None,
+        )
+
+    @property
+    def mixture(self) -> MixtureDistribution:
+        """Active (non degenerated) distributions getter"""
+
+        if self._mixture is None:
+            self._mixture = MixtureDistribution(
+                [self.distribution(ind) for ind in np.flatnonzero(self._alive)],
+                normalize=False,
+            )
+        return self._mixture
+
+    @property
+    def all_mixture(self) -> MixtureDistribution:
+        """All distributions getter"""
+
+        if self._all_mixture is None:
+            self._all_mixture = MixtureDistribution(
+                [self.distribution(ind) for ind in range(len(self._alive))],
+                normalize=False,
+            )
+        return self._all_mixture
+
+    def normalize(self) -> None:
+        """
+        Normalizing method, which is used to maintain the invariant:
+        sum of prior probabilities of alive distributions is equal to one.
+        """
+
+        self._priors[~self._alive] = 0.0
+        s = np.sum(self._priors)
+        if s:
+            self._priors /= s
+
+    def update(
+        self,
+        mixture_distribution: MixtureDistribution,
+        distribution_checker: Callable[[DistributionInMixture], bool] | None = None,
+    ) -> None:
+        """
+        Updating active distributions by given one.
+        Applies distribution checker function to active distributions.
+        Marks degenerated ones as not alive and sets their prior probabilities to zero.
+        """
+
+        active_indexes = np.flatnonzero(self._alive)
+        if len(mixture_distribution) != len(active_indexes):
+            raise ValueError(
+                "New mixture distribution size must be the same with previous"
+            )
+
+        for ind, d in zip(active_indexes, mixture_distribution):
+            self._params[ind, : self._sizes[ind]] = d.params
+            if d.prior_probability is None:
+                self._alive[ind] = False
+                continue
+            self._priors[ind] = d.prior_probability
+            if distribution_checker is not None and not distribution_checker(d):
+                self._alive[ind] = False
+
+        self.normalize()
+        self._mixture = None
+        self._all_mixture = None
+
+    def copy(self) -> "MixtureState":
+        """Creates copy of state"""
+
+        return MixtureState(
+            self._models,
+            self._model_ids.copy(),
+            self._params.copy(),
+            self._sizes.copy(),
+            self._priors.copy(),
+            self._alive.copy(),
+        )
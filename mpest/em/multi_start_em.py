@@ -0,0 +1,257 @@
+"""
+Module which represents EM algorithm with multiple initializations,
+which are solved in parallel and pruned by log-likelihood
+"""
+
+import copy
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable
+
+import numpy as np
+from scipy.special import logsumexp
+
+from mpest.em.em import EM
+from mpest.mixture_distribution import DistributionInMixture, MixtureDistribution
+from mpest.problem import ASolver, Problem, Result
+from mpest.sample_sources import ASampleSource, iterate_chunks
+from mpest.types import Samples
+from mpest.utils import ResultWithError
+
+
+def mixture_log_likelihood(
+    mixture: MixtureDistribution, samples: Samples | ASampleSource
+) -> float:
+    """Log-likelihood of samples for given mixture distribution"""
+
+    distributions = [
+        (
+            np.log(d.prior_probability),
+            d.model,
+            d.model.params_convert_to_model(d.params),
+        )
+        for d in mixture
+        if d.prior_probability
+    ]
+    if not distributions:
+        return -np.inf
+
+    ll = 0.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for chunk in iterate_chunks(samples):
+            lp = [lw + model.lpdf_samples(chunk, p) for lw, model, p in distributions]
+            ll += float(np.sum(logsumexp(lp, axis=0)))
+    return -np.inf if np.isnan(ll) else ll
+
+
+class _RoundBreakpointer(EM.ABreakpointer):
+    """
+    EM breakpointer, which stops solving after given steps count
+    and passes global step number to the wrapped breakpointer.
+
+    The first step of round gets previous step from the end of the previous round,
+    so the wrapped breakpointer sees the same steps as in a single EM run.
+    """
+
+    def __init__(
+        self,
+        breakpointer: EM.ABreakpointer,
+        offset: int,
+        round_steps: int,
+        previous_step: MixtureDistribution | None = None,
+    ) -> None:
+        self._breakpointer = breakpointer
+        self._offset = offset
+        self._round_steps = round_steps
+        self.previous_step = previous_step
+
+    @property
+    def name(self):
+        return self._breakpointer.name
+
+    def is_over(
+        self,
+        step: int,
+        previous_step: MixtureDistribution | None,
+        current_step: MixtureDistribution,
+    ) -> bool:
+        if step == 0 and previous_step is None:
+            previous_step = self.previous_step
+        self.previous_step = previous_step
+
+        if step >= self._round_steps:
+            return True
+        return self._breakpointer.is_over(
+            step + self._offset, previous_step, current_step
+        )
+
+    def update_log_likelihood(self, step: int, log_likelihood: float | None) -> None:
+        self._breakpointer.update_log_likelihood(step + self._offset, log_likelihood)
+
+
+class _RoundDistributionChecker(EM.ADistributionChecker):
+    """Distribution checker, which passes global step number to the wrapped one"""
+
+    def __init__(self, distribution_checker: EM.ADistributionChecker, offset: int):
+        self._distribution_checker = distribution_checker
+        self._offset = offset
+
+    @property
+    def name(self):
+        return self._distribution_checker.name
+
+    def is_alive(self, step: int, distribution: DistributionInMixture) -> bool:
+        return self._distribution_checker.is_alive(step + self._offset, distribution)
+
+
+def _solve_round(
+    em: EM,
+    problem: Problem,
+    offset: int,
+    round_steps: int,
+    previous_step: MixtureDistribution | None,
+) -> tuple[EM, MixtureDistribution, int, float, MixtureDistribution | None]:
+    """
+    Makes no more than round_steps EM steps, starting from step with given number.
+    Returns the EM (it's breakpointer can be updated in another process),
+    the result mixture, made steps count, it's log-likelihood
+    and previous step for the next round.
+    """
+
+    breakpointer = _RoundBreakpointer(
+        em.breakpointer, offset, round_steps, previous_step
+    )
+    em_round = EM(
+        breakpointer,
+        _RoundDistributionChecker(em.distribution_checker, offset),
+        em.method,
+    )
+    result = em_round.solve_logged(problem, True, False, False)
+    mixture = result.content.content
+    ll = mixture_log_likelihood(mixture, problem.samples)
+    return em, mixture, result.log.steps, ll, breakpointer.previous_step
+
+
+class MultiStartEM(ASolver):
+    """
+    Class which represents EM algorithm with multiple initializations.
+
+    Starts are solved in rounds of few EM steps on the thread or process pool.
+    After each round starts, which average log-likelihood is less than the best one
+    by more than prune tolerance, are abandoned,
+    so the remaining steps are given only to the promising starts.
+    The result is the mixture with the best log-likelihood.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        em: EM,
+        initializations: (
+            Callable[[MixtureDistribution], MixtureDistribution]
+            | Iterable[MixtureDistribution]
+        ),
+        starts: int = 8,
+        round_steps: int = 4,
+        max_rounds: int = 16,
+        prune_tolerance: float = 0.05,
+        cpu_count: int = 1,
+        processes: bool = False,
+    ) -> None:
+        """
+        Object constructor
+
+        :param em: EM algorithm, which solves every start.
+        It's breakpointer and distribution checker get the number of step from the beginning.
+        :param initializations: Function, which creates initial mixture
+        by the initial mixture of the problem, or iterable of initial mixtures.
+        The initial mixture of the problem is always used as the first start.
+        :param starts: Count of starts
+        :param round_steps: Count of EM steps between comparing of starts
+        :param max_rounds: Max count of rounds
+        :param prune_tolerance: Max differ of average log-likelihood of samples
+        between start and the best one, which doesn't lead to abandoning the start
+        :param cpu_count: Count of workers
+        :param processes: Use process pool instead of thread pool
+        """
+
+        # pylint: disable=too-many-arguments
+
+        self.em = em
+        self.initializations = initializations
+        self.starts = starts
+        self.round_steps = round_steps
+        self.max_rounds = max_rounds
+        self.prune_tolerance = prune_tolerance
+        self.cpu_count = cpu_count
+        self.processes = processes
+
+    def _initial_mixtures(self, problem: Problem) -> list[MixtureDistribution]:
+        """Initial mixtures of all starts"""
+
+        if callable(self.initializations):
+            others = [
+                self.initializations(problem.distributions)
+                for _ in range(self.starts - 1)
+            ]
+        else:
+            others = list(islice(self.initializations, self.starts - 1))
+        return [problem.distributions] + others
+
+    def _executor(self) -> Executor:
+        """Creates pool of workers"""
+
+        if self.processes:
+            return ProcessPoolExecutor(max_workers=self.cpu_count)
+        return ThreadPoolExecutor(max_workers=self.cpu_count)
+
+    def solve(self, problem: Problem) -> Result:
+        """
+        Solve problem with EM algorithm from multiple initializations
+
+        :param problem: Problem with your mixture with initial parameters
+        """
+
+        mixtures = self._initial_mixtures(problem)
+        # Each start has it's own EM, because methods can cache samples data
+        ems = [copy.deepcopy(self.em) for _ in mixtures]
+        lls = np.array([mixture_log_likelihood(m, problem.samples) for m in mixtures])
+        steps = np.zeros(len(mixtures), dtype=int)
+        previous_steps: list[MixtureDistribution | None] = [None] * len(mixtures)
+        running = np.ones(len(mixtures), dtype=bool)
+
+        with self._executor() as executor:
+            for _ in range(self.max_rounds):
+                if not np.any(running):
+                    break
+
+                indexes = np.flatnonzero(running)
+                futures = [
+                    executor.submit(
+                        _solve_round,
+                        ems[i],
+                        Problem(problem.samples, mixtures[i]),
+                        steps[i],
+                        self.round_steps,
+                        previous_steps[i],
+                    )
+                    for i in indexes
+                ]
+                for i, future in zip(indexes, futures):
+                    (
+                        ems[i],
+                        mixtures[i],
+                        made_steps,
+                        lls[i],
+                        previous_steps[i],
+                    ) = future.result()
+                    steps[i] += made_steps
+                    if made_steps < self.round_steps:
+                        running[i] = False
+
+                # Abandoning dominated starts
+                gaps = (np.max(lls) - lls) / len(problem.samples)
+                running &= ~(gaps > self.prune_tolerance)
+
+        return ResultWithError(mixtures[int(np.argmax(lls))])
@@ -0,0 +1,165 @@
+"""Module which represents online EM algorithm for streaming samples"""
+
+from typing import Callable, Iterable
+
+import numpy as np
+
+from mpest.distribution import Distribution
+from mpest.em.em import EM
+from mpest.em.methods.likelihood_method import ChunkedBayesEStep
+from mpest.em.mixture_state import MixtureState
+from mpest.mixture_distribution import DistributionInMixture, MixtureDistribution
+from mpest.models import AModelWithSufficientStatistics
+from mpest.problem import Problem, Result
+from mpest.types import Samples
+from mpest.utils import ResultWithError
+
+
+def default_step_size(step: int) -> float:
+    """
+    Step size schedule (step + 1)^(-0.51).
+    First batch replaces initial statistics, power close to 0.5 forgets
+    initial approximation quickly, while sum of squares of step sizes is finite.
+    """
+
+    return (step + 1) ** -0.51
+
+
+def _convert_params(
+    mixture: MixtureDistribution, to_model: bool
+) -> MixtureDistribution:
+    """Converts params of distributions of mixture to model params or back"""
+
+    return MixtureDistribution(
+        [
+            DistributionInMixture(
+                d.model,
+                d.model.params_convert_to_model(d.params)
+                if to_model
+                else d.model.params_convert_from_model(d.params),
+                d.prior_probability,
+            )
+            for d in mixture
+        ],
+        normalize=False,
+    )
+
+
+class OnlineEM:
+    """
+    Class which represents online (stepwise) EM algorithm with likelihood method.
+
+    Samples are consumed by mini-batches, only running averages of
+    sufficient statistics of each distribution are kept in memory:
+    S = (1 - g) * S + g * s, where s is statistics of the batch
+    and g is the step size of the current step.
+    Mixture is updated after each batch in closed form,
+    so all models must have sufficient statistics.
+    """
+
+    def __init__(
+        self,
+        mixture: MixtureDistribution,
+        step_size: Callable[[int], float] = default_step_size,
+        distribution_checker: EM.ADistributionChecker | None = None,
+    ) -> None:
+        """
+        Object constructor
+
+        :param mixture: Initial mixture distribution
+        :param step_size: Step size schedule, step number -> step size from (0, 1]
+        :param distribution_checker: Checker of distributions after each batch
+        """
+
+        for d in mixture:
+            if not isinstance(d.model, AModelWithSufficientStatistics):
+                raise TypeError(f"Model {d.model.name} hasn't sufficient statistics")
+
+        self.step_size = step_size
+        self.distribution_checker = distribution_checker
+
+        self._state = MixtureState.from_mixture(_convert_params(mixture, True))
+        self._weights = np.zeros(len(mixture))
+        self._statistics: list[np.ndarray | None] = [None] * len(mixture)
+        self._e_step = ChunkedBayesEStep(memory_budget=None)
+        self._step = 0
+
+    @property
+    def step(self) -> int:
+        """Count of processed batches getter"""
+        return self._step
+
+    @property
+    def log_likelihood(self) -> float | None:
+        """Log-likelihood of the last batch for mixture before it's processing"""
+        return self._e_step.log_likelihood
+
+    @property
+    def mixture(self) -> MixtureDistribution:
+        """Current mixture distribution getter"""
+
+        return _convert_params(self._state.all_mixture, False)
+
+    def partial_fit(self, samples: Samples) -> Result:
+        """
+        Updates mixture by one batch of samples
+
+        :param samples: Batch of samples
+        :return: Current mixture distribution and error, if batch can't be processed
+        """
+
+        e_result = self._e_step.step(Problem(samples, self._state.mixture))
+        if isinstance(e_result, ResultWithError):
+            return ResultWithError(self.mixture, e_result.error)
+
+        # Running averages are kept for statistics with shift of the first batch
+        self._e_step.shift = e_result.shift
+
+        g = self.step_size(self._step)
+        distributions = []
+        for j, statistics, weight in zip(
+            np.flatnonzero(self._state.alive), e_result.statistics, e_result.weights
+        ):
+            model = self._state.model(j)
+            statistics = statistics / e_result.count
+            if self._statistics[j] is None:
+                self._statistics[j] = np.zeros_like(statistics)
+            self._statistics[j] = (1 - g) * self._statistics[j] + g * statistics
+            self._weights[j] = (1 - g) * self._weights[j] + g * weight / e_result.count
+            distributions.append(
+                Distribution(
+                    model,
+                    model.params_from_statistics(
+                        self._statistics[j], self._weights[j], e_result.shift
+                    ),
+                )
+            )
+
+        step = self._step
+        self._state.update(
+            MixtureDistribution.from_distributions(
+                distributions, list(self._weights[self._state.alive])
+            ),
+            None
+            if self.distribution_checker is None
+            else lambda d: self.distribution_checker.is_alive(step, d),
+        )
+        self._step += 1
+
+        error = Exception("All distributions failed") if len(self._state) == 0 else None
+        return ResultWithError(self.mixture, error)
+
+    def fit(self, batches: Iterable[Samples]) -> Result:
+        """
+        Updates mixture by batches of samples, stops on the first error
+
+        :param batches: Iterable of batches of samples
+        :return: Current mixture distribution and error, if any batch can't be processed
+        """
+
+        result = ResultWithError(self.mixture)
+        for samples in batches:
+            result = self.partial_fit(samples)
+            if result.error:
+                break
+        return result
@@ -61,9 +61,19 @@ class MixtureDistribution(
     def __init__(
         self,
         distributions: list[DistributionInMixture],
+        normalize: bool = True,
     ) -> None:
+        """
+        Object constructor
+
+        :param distributions: Distributions in mixture
+        :param normalize: Normalize prior probabilities of distributions.
+        Default is True, False can be used if they are already normalized
+        """
+
         self._distributions = distributions
-        self._normalize()
+        if normalize:
+            self._normalize()
 
     @classmethod
     def from_distributions(
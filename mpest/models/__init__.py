@@ -3,6 +3,7 @@ from mpest.models.abstract_model import (
     AModel,
     AModelDifferentiable,
     AModelWithGenerator,
+    AModelWithSufficientStatistics,
 )
 from mpest.models.exponential import ExponentialModel
 from mpest.models.gaussian import GaussianModel
@@ -36,6 +36,37 @@ class AModel(ANamed, ABC):
         for speed improvements if it possible
         """
 
+    def pdf_samples(self, samples: Samples, params: Params) -> np.ndarray:
+        """
+        Probability density function, calculated for all samples at once.
+
+        Default implementation calls pdf for each sample,
+        models should override it with vectorized one.
+        """
+
+        return np.array([self.pdf(x, params) for x in samples], dtype=float)
+
+    def lpdf_samples(self, samples: Samples, params: Params) -> np.ndarray:
+        """
+        Logarithm of probability density function, calculated for all samples at once.
+
+        Default implementation calls lpdf for each sample,
+        models should override it with vectorized one.
+        """
+
+        return np.array([self.lpdf(x, params) for x in samples], dtype=float)
+
+    @property
+    def params_broadcasting(self) -> bool:
+        """
+        True if lpdf_samples broadcasts each param with samples,
+        so params of shape (len(params), b, 1) with samples of shape (b, n)
+        give result of shape (b, n), row i is calculated with params i.
+        Default is False, which means that params must be one-dimensional.
+        """
+
+        return False
+
 
 class AModelDifferentiable(AModel, ABC):
     """Abstract class which extends AModel by adding derivatives"""
@@ -47,6 +78,22 @@ class AModelDifferentiable(AModel, ABC):
         with respects to all it's params
         """
 
+    def ld_params_samples(self, samples: Samples, params: Params) -> np.ndarray:
+        """
+        Method which returns matrix of logarithms of partial derivatives
+        with respects to all it's params, calculated for all samples at once.
+        Shape of result is (len(params), len(samples)).
+
+        Default implementation calls ld_params for each sample,
+        models should override it with vectorized one.
+        """
+
+        return (
+            np.array([self.ld_params(x, params) for x in samples], dtype=float)
+            .reshape(len(samples), len(params))
+            .T
+        )
+
 
 class AModelWithGenerator(AModel, ABC):
     """
@@ -67,3 +114,55 @@ class AModelWithGenerator(AModel, ABC):
 
         :return: Samples with elements that belong to the distribution density of this model
         """
+
+
+class AModelWithSufficientStatistics(AModel, ABC):
+    """
+    Abstract class which extends AModel by adding sufficient statistics,
+    which allows to find maximum of weighted likelihood in closed form
+    """
+
+    @property
+    @abstractmethod
+    def statistics_count(self) -> int:
+        """Count of sufficient statistics of each sample getter"""
+
+    @abstractmethod
+    def sufficient_statistics(
+        self, samples: Samples, shift: float | np.ndarray = 0.0
+    ) -> np.ndarray:
+        """
+        Method which returns sufficient statistics of each sample.
+        Shape of result is (statistics count, len(samples)).
+
+        :param samples: Samples
+        :param shift: Samples are shifted by it before calculating statistics.
+        Shift close to samples keeps sums of statistics accurate,
+        when samples are far from zero.
+        """
+
+    @abstractmethod
+    def params_from_statistics(
+        self, statistics: np.ndarray, weight: float, shift: float | np.ndarray = 0.0
+    ) -> Params:
+        """
+        Method which returns params maximizing weighted likelihood
+
+        :param statistics: Weighted sums of sufficient statistics of samples
+        :param weight: Sum of weights of samples
+        :param shift: Shift of samples, which was used to calculate statistics
+        """
+
+    def weighted_mle(self, samples: Samples, weights: np.ndarray) -> Params:
+        """
+        Method which returns params maximizing weighted likelihood
+        of given samples with given weights.
+        Samples are shifted by their mean before calculating statistics.
+        """
+
+        shift = np.mean(samples, axis=-1)
+        statistics = np.sum(
+            self.sufficient_statistics(samples, np.expand_dims(shift, -1)) * weights,
+            axis=-1,
+        )
+        return self.params_from_statistics(statistics, np.sum(weights, axis=-1), shift)
@@ -3,7 +3,11 @@
 import numpy as np
 from scipy.stats import expon
 
-from mpest.models.abstract_model import AModelDifferentiable, AModelWithGenerator
+from mpest.models.abstract_model import (
+    AModelDifferentiable,
+    AModelWithGenerator,
+    AModelWithSufficientStatistics,
+)
 from mpest.types import Params, Samples
 
 
@@ -21,7 +25,10 @@ class LMomentsParameterMixin:
 
 
 class ExponentialModel(
-    AModelDifferentiable, AModelWithGenerator, LMomentsParameterMixin
+    AModelDifferentiable,
+    AModelWithGenerator,
+    AModelWithSufficientStatistics,
+    LMomentsParameterMixin,
 ):
     """
     f(x) = l * e^(-lx)
@@ -35,6 +42,10 @@ class ExponentialModel(
     def name(self) -> str:
         return "Exponential"
 
+    @property
+    def params_broadcasting(self) -> bool:
+        return True
+
     def params_convert_to_model(self, params):
         return np.log(params)
 
@@ -62,6 +73,14 @@ class ExponentialModel(
         (l,) = params
         return l - np.exp(l) * x
 
+    def pdf_samples(self, samples: Samples, params: Params) -> np.ndarray:
+        (l,) = params
+        return np.where(samples < 0, 0.0, np.exp(l - np.exp(l) * samples))
+
+    def lpdf_samples(self, samples: Samples, params: Params) -> np.ndarray:
+        (l,) = params
+        return np.where(samples < 0, -np.inf, l - np.exp(l) * samples)
+
     def ldl(self, x: float, params: Params) -> float:
         """Method which returns logarithm of derivative with respect to parameter l"""
 
@@ -73,6 +92,26 @@ class ExponentialModel(
     def ld_params(self, x: float, params: Params) -> np.ndarray:
         return np.array([self.ldl(x, params)])
 
+    def ld_params_samples(self, samples: Samples, params: Params) -> np.ndarray:
+        (l,) = params
+        return np.stack([np.where(samples < 0, -np.inf, 1 - np.exp(l) * samples)])
+
+    @property
+    def statistics_count(self) -> int:
+        return 1
+
+    def sufficient_statistics(
+        self, samples: Samples, shift: float | np.ndarray = 0.0
+    ) -> np.ndarray:
+        return np.stack([samples - shift])
+
+    def params_from_statistics(
+        self, statistics: np.ndarray, weight: float, shift: float | np.ndarray = 0.0
+    ) -> Params:
+        (s1,) = statistics
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.array([np.log(weight) - np.log(s1 + shift * weight)])
+
     def calc_params(self, moments: list[float]):
         """
         The function for calculating params using L moments
@@ -3,7 +3,11 @@
 import numpy as np
 from scipy.stats import norm
 
-from mpest.models.abstract_model import AModelDifferentiable, AModelWithGenerator
+from mpest.models.abstract_model import (
+    AModelDifferentiable,
+    AModelWithGenerator,
+    AModelWithSufficientStatistics,
+)
 from mpest.types import Params, Samples
 
 
@@ -28,7 +32,12 @@ class LMomentsParameterMixin:
         return m2 * np.sqrt(np.pi)
 
 
-class GaussianModel(AModelDifferentiable, AModelWithGenerator, LMomentsParameterMixin):
+class GaussianModel(
+    AModelDifferentiable,
+    AModelWithGenerator,
+    AModelWithSufficientStatistics,
+    LMomentsParameterMixin,
+):
     """
     f(x) = e^(-1/2 * ((x - m) / sd)^2) / (sd * sqrt(2pi))
 
@@ -41,6 +50,10 @@ class GaussianModel(AModelDifferentiable, AModelWithGenerator, LMomentsParameter
     def name(self) -> str:
         return "Gaussian"
 
+    @property
+    def params_broadcasting(self) -> bool:
+        return True
+
     def params_convert_to_model(self, params: Params) -> Params:
         return np.array([params[0], np.log(params[1])])
 
@@ -67,6 +80,15 @@ class GaussianModel(AModelDifferentiable, AModelWithGenerator, LMomentsParameter
             return -np.inf
         return np.log(p)
 
+    def pdf_samples(self, samples: Samples, params: Params) -> np.ndarray:
+        m, sd = params
+        sd = np.exp(sd)
+        return np.exp(-0.5 * (((samples - m) / sd) ** 2)) / (sd * np.sqrt(2 * np.pi))
+
+    def lpdf_samples(self, samples: Samples, params: Params) -> np.ndarray:
+        m, sd = params
+        return -0.5 * (((samples - m) / np.exp(sd)) ** 2) - sd - 0.5 * np.log(2 * np.pi)
+
     def ldm(self, x: float, params: Params) -> float:
         """Method which returns logarithm of derivative with respect to mean"""
 
@@ -82,6 +104,41 @@ class GaussianModel(AModelDifferentiable, AModelWithGenerator, LMomentsParameter
     def ld_params(self, x: float, params: Params) -> np.ndarray:
         return np.array([self.ldm(x, params), self.ldsd(x, params)])
 
+    def ld_params_samples(self, samples: Samples, params: Params) -> np.ndarray:
+        m, sd = params
+        z = (samples - m) / np.exp(2 * sd)
+        return np.stack([z, z * (samples - m) - 1])
+
+    @property
+    def statistics_count(self) -> int:
+        return 2
+
+    def sufficient_statistics(
+        self, samples: Samples, shift: float | np.ndarray = 0.0
+    ) -> np.ndarray:
+        d = samples - shift
+        return np.stack([d, d**2])
+
+    def params_from_statistics(
+        self, statistics: np.ndarray, weight: float, shift: float | np.ndarray = 0.0
+    ) -> Params:
+        s1, s2 = statistics
+        with np.errstate(divide="ignore", invalid="ignore"):
+            d = s1 / weight
+            return np.array([shift + d, 0.5 * np.log(s2 / weight - d**2)])
+
+    def weighted_mle(self, samples: Samples, weights: np.ndarray) -> Params:
+        # Variance is calculated by deviations from mean,
+        # which is accurate for samples far from zero
+        weight = np.sum(weights, axis=-1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            m = np.sum(samples * weights, axis=-1) / weight
+            variance = (
+                np.sum((samples - np.expand_dims(m, -1)) ** 2 * weights, axis=-1)
+                / weight
+            )
+            return np.array([m, 0.5 * np.log(variance)])
+
     def calc_params(self, moments: list[float]) -> np.ndarray:
         """
         The function for calculating params using L moments
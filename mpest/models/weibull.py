@@ -3,6 +3,7 @@
 import math
 
 import numpy as np
+from scipy.special import xlogy  # pylint: disable=no-name-in-module
 from scipy.stats import weibull_min
 
 from mpest.models.abstract_model import AModelDifferentiable, AModelWithGenerator
@@ -49,6 +50,10 @@ class WeibullModelExp(
     def name(self) -> str:
         return "WeibullExp"
 
+    @property
+    def params_broadcasting(self) -> bool:
+        return True
+
     def params_convert_to_model(self, params: Params) -> Params:
         return np.log(params)
 
@@ -83,6 +88,20 @@ class WeibullModelExp(
         lx = np.log(x)
         return k - ((x / el) ** ek) - ek * l - lx + ek * lx
 
+    def pdf_samples(self, samples: Samples, params: Params) -> np.ndarray:
+        ek, el = np.exp(params)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            xl = np.maximum(samples, 0.0) / el
+            p = (ek / el) * (xl ** (ek - 1.0)) / np.exp(xl**ek)
+        return np.where(samples < 0, 0.0, p)
+
+    def lpdf_samples(self, samples: Samples, params: Params) -> np.ndarray:
+        k, l = params
+        ek, el = np.exp(params)
+        x = np.maximum(samples, 0.0)
+        lp = k - ((x / el) ** ek) - ek * l + xlogy(ek - 1.0, x)
+        return np.where(samples < 0, -np.inf, lp)
+
     def ldk(self, x: float, params: Params) -> float:
         """Method which returns logarithm of derivative with respect to k"""
 
@@ -103,6 +122,18 @@ class WeibullModelExp(
     def ld_params(self, x: float, params: Params) -> np.ndarray:
         return np.array([self.ldk(x, params), self.ldl(x, params)])
 
+    def ld_params_samples(self, samples: Samples, params: Params) -> np.ndarray:
+        ek, el = np.exp(params)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            xl = np.maximum(samples, 0.0) / el
+            xlk = xl**ek
+            ldk = 1.0 - ek * (xlk - 1.0) * np.log(xl)
+            ldl = ek * (xlk - 1.0)
+        negative = samples < 0
+        return np.stack(
+            [np.where(negative, -np.inf, ldk), np.where(negative, -np.inf, ldl)]
+        )
+
     def calc_params(self, moments: list[float]):
         """
         The function for calculating params using L moments
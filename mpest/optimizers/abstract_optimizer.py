@@ -33,5 +33,35 @@ class AOptimizerJacobian(ANamed, ABC):
     ) -> Params:
         """Optimization minimization method, which also needs jacobian for work"""
 
+    def minimize_fused(
+        self,
+        func_and_jacobian: Callable[[Params], tuple[float, np.ndarray]],
+        params: Params,
+    ) -> Params:
+        """
+        Optimization minimization method, which gets function value
+        and jacobian from one call, so they can share calculations.
+
+        Default implementation calls minimize method with function and jacobian,
+        which share the result of the last call, so objective is calculated
+        once for each point. Optimizers should override it
+        if they support such functions.
+        """
+
+        # Last point and function value with jacobian in it
+        last: list = [None, None]
+
+        def evaluate(x: Params) -> tuple[float, np.ndarray]:
+            if last[0] is None or not np.array_equal(last[0], x):
+                last[1] = func_and_jacobian(x)
+                last[0] = np.array(x, dtype=float)
+            return last[1]
+
+        return self.minimize(
+            lambda x: evaluate(x)[0],
+            params,
+            jacobian=lambda x: evaluate(x)[1],
+        )
+
 
 TOptimizer = AOptimizer | AOptimizerJacobian
@@ -23,3 +23,10 @@ class ScipyNewtonCG(AOptimizerJacobian):
         jacobian: Callable[[Params], np.ndarray],
     ) -> Params:
         return minimize(func, params, jac=jacobian, method="Newton-CG").x
+
+    def minimize_fused(
+        self,
+        func_and_jacobian: Callable[[Params], tuple[float, np.ndarray]],
+        params: Params,
+    ) -> Params:
+        return minimize(func_and_jacobian, params, jac=True, method="Newton-CG").x
@@ -1,8 +1,10 @@
 """Module which represents problem, which can be solved by using this lib."""
 
 from abc import ABC, abstractmethod
+from typing import Iterator
 
 from mpest.mixture_distribution import MixtureDistribution
+from mpest.sample_sources import DEFAULT_CHUNK_SIZE, ASampleSource, iterate_chunks
 from mpest.types import Samples
 from mpest.utils import ResultWithError
 
@@ -13,11 +15,13 @@ class Problem:
 
     Described by samples and the initial approximation.
     Initial approximation is an mixture distribution.
+    Samples can be given as array or as samples source,
+    which is read into memory by steps, which don't support chunks.
     """
 
     def __init__(
         self,
-        samples: Samples,
+        samples: Samples | ASampleSource,
         distributions: MixtureDistribution,
     ) -> None:
         self._samples = samples
@@ -33,6 +37,15 @@ class Problem:
         """Distributions getter"""
         return self._distributions
 
+    def chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Samples]:
+        """
+        Iterates over samples by chunks
+
+        :param chunk_size: Max size of chunk
+        """
+
+        return iterate_chunks(self._samples, chunk_size)
+
 
 Result = ResultWithError[MixtureDistribution]
 
@@ -0,0 +1,214 @@
+"""
+Module which represents sample sources, which don't keep all samples in memory:
+- MemoryMappedSamples, samples from .npy or raw binary file
+- ChunkedSamples, samples from chunks provider
+
+and helpers for samples, which are given as array
+or shared with worker processes.
+"""
+
+from abc import ABC, abstractmethod
+from multiprocessing.shared_memory import SharedMemory
+from os import PathLike
+from typing import Callable, Iterable, Iterator, Sized
+
+import numpy as np
+
+from mpest.types import Samples
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Shared memory block and samples array, attached by worker process
+_worker_samples: dict[str, tuple[SharedMemory, np.ndarray]] = {}
+
+
+class ASampleSource(Sized, ABC):
+    """
+    Abstract class which represents source of samples,
+    which can be read by chunks with bounded memory usage.
+    """
+
+    @abstractmethod
+    def chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Samples]:
+        """
+        Iterates over samples by chunks in the same order every time
+
+        :param chunk_size: Max size of chunk
+        """
+
+    def take(self, indices: np.ndarray) -> Samples:
+        """
+        Reads samples with given indices in ascending order of indices
+        by a single pass over chunks
+
+        :param indices: Indices of samples
+        """
+
+        indices = np.sort(indices)
+        parts = []
+        start = 0
+        for chunk in self.chunks():
+            stop = start + len(chunk)
+            left, right = np.searchsorted(indices, [start, stop])
+            parts.append(chunk[indices[left:right] - start])
+            start = stop
+        return np.concatenate(parts or [np.empty(0)])
+
+    def __array__(self, dtype=None, copy=None):
+        """Reads all samples into memory, so samples are always copied"""
+
+        if copy is False:
+            raise ValueError("Samples source can't be converted to array without copy")
+        samples = np.concatenate(list(self.chunks()) or [np.empty(0)])
+        return samples if dtype is None else samples.astype(dtype)
+
+
+class MemoryMappedSamples(ASampleSource):
+    """
+    Class which represents samples from memory-mapped file.
+    File can be .npy file with one-dimensional array or raw binary file.
+    """
+
+    def __init__(
+        self,
+        path: str | PathLike,
+        raw: bool = False,
+        dtype: np.dtype | type = np.float64,
+    ) -> None:
+        """
+        Object constructor
+
+        :param path: Path to file
+        :param raw: True if file is raw binary file, False if it's .npy file
+        :param dtype: Type of raw binary file elements
+        """
+
+        self._path = path
+        self._raw = raw
+        self._dtype = dtype
+
+        if raw:
+            self._samples = np.memmap(path, dtype=dtype, mode="r")
+        else:
+            self._samples = np.load(path, mmap_mode="r")
+        if self._samples.ndim != 1:
+            raise ValueError("Samples must be one-dimensional")
+
+    @property
+    def samples(self) -> np.memmap:
+        """Memory-mapped samples getter"""
+        return self._samples
+
+    def __len__(self):
+        return len(self._samples)
+
+    def __reduce__(self):
+        # File is mapped again instead of copying samples, e.g. to another process
+        return MemoryMappedSamples, (self._path, self._raw, self._dtype)
+
+    def chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Samples]:
+        for start in range(0, len(self._samples), chunk_size):
+            yield np.array(self._samples[start : start + chunk_size], dtype=float)
+
+    def take(self, indices: np.ndarray) -> Samples:
+        return np.array(self._samples[np.sort(indices)], dtype=float)
+
+
+class ChunkedSamples(ASampleSource):
+    """
+    Class which represents samples from chunks provider.
+    Provider is called every time samples are iterated,
+    it's chunks are regrouped into chunks of requested size.
+    """
+
+    def __init__(
+        self,
+        provider: Callable[[], Iterable[Samples]],
+        length: int | None = None,
+    ) -> None:
+        """
+        Object constructor
+
+        :param provider: Function, which returns new iterable of chunks
+        :param length: Count of samples. Calculated by iterating chunks if None.
+        """
+
+        self._provider = provider
+        self._length = length
+
+    def __len__(self):
+        if self._length is None:
+            self._length = sum(len(chunk) for chunk in self._provider())
+        return self._length
+
+    def chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Samples]:
+        buffer: list[np.ndarray] = []
+        buffer_size = 0
+        for chunk in self._provider():
+            chunk = np.asarray(chunk, dtype=float)
+            while buffer_size + len(chunk) >= chunk_size:
+                rest = chunk_size - buffer_size
+                yield np.concatenate(buffer + [chunk[:rest]])
+                buffer, buffer_size, chunk = [], 0, chunk[rest:]
+            if len(chunk):
+                buffer.append(chunk)
+                buffer_size += len(chunk)
+        if buffer:
+            yield np.concatenate(buffer)
+
+
+def iterate_chunks(
+    samples: Samples | ASampleSource, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Samples]:
+    """
+    Iterates over samples array or samples source by chunks
+
+    :param samples: Samples array or samples source
+    :param chunk_size: Max size of chunk
+    """
+
+    if isinstance(samples, ASampleSource):
+        yield from samples.chunks(chunk_size)
+        return
+    for start in range(0, len(samples), chunk_size):
+        yield samples[start : start + chunk_size]
+
+
+def samples_array(samples: Samples | ASampleSource) -> Samples:
+    """
+    Gives samples array or memory-mapped samples as array without copying.
+    Other samples sources aren't read into memory,
+    they can be processed only by chunks.
+
+    :param samples: Samples array or samples source
+    :raises TypeError: If samples source can't be given as array
+    """
+
+    if isinstance(samples, MemoryMappedSamples):
+        return np.asarray(samples.samples, dtype=float)
+    if isinstance(samples, ASampleSource):
+        raise TypeError(
+            f"Samples source {type(samples).__name__} can be processed only by chunks"
+        )
+    return np.asarray(samples)
+
+
+def attach_shared_samples(name: str, size: int) -> np.ndarray:
+    """
+    Attaches worker process to samples in shared memory.
+    Worker process keeps only the last attached block,
+    so the same samples aren't attached again by following tasks.
+
+    :param name: Name of shared memory block
+    :param size: Count of samples in shared memory block
+    """
+
+    if name not in _worker_samples:
+        for shared_memory, _ in _worker_samples.values():
+            shared_memory.close()
+        _worker_samples.clear()
+
+        shared_memory = SharedMemory(name=name)
+        samples = np.ndarray((size,), dtype=np.float64, buffer=shared_memory.buf)
+        _worker_samples[name] = (shared_memory, samples)
+    return _worker_samples[name][1]
@@ -1,11 +1,13 @@
 """Module which provides many useful utils for improving code writing experience"""
 
 import functools
-import os
+import math
 import time
 from abc import ABC, abstractmethod
 from typing import Callable, Generic, Iterator, ParamSpec, TypeVar
 
+import numpy as np
+
 P = ParamSpec("P")
 R = TypeVar("R")
 T = TypeVar("T")
@@ -274,13 +276,14 @@ def in_bounds(min_value: float, max_value: float):
     return current_in_bounds
 
 
-def find_file(name, path):
+def binom(n, k: int):
     """
-    A function for finding the path to a file
+    Binomial coefficient C(n, k), which is zero if n < k.
+    Works with arrays of n, calculated as falling factorial divided by k!
     """
-    # pylint: disable=unused-variable
-    for root, dirs, files in os.walk(path):
-        if name in files:
-            return os.path.join(root, name)
 
-    return ""
+    n = np.asarray(n, dtype=float)
+    result = np.ones_like(n)
+    for i in range(k):
+        result *= np.maximum(n - i, 0.0)
+    return result / math.factorial(k)
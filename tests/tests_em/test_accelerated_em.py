@@ -0,0 +1,118 @@
+"""Unit test module which tests EM algorithm with SQUAREM acceleration"""
+
+# pylint: disable=duplicate-code
+
+import numpy as np
+import pytest
+
+from mpest.distribution import Distribution
+from mpest.em import EM, AcceleratedEM
+from mpest.em.breakpointers import ParamDifferBreakpointer, StepCountBreakpointer
+from mpest.em.distribution_checkers import (
+    FiniteChecker,
+    PriorProbabilityThresholdChecker,
+)
+from mpest.em.methods.l_moments_method import IndicatorEStep, LMomentsMStep
+from mpest.em.methods.likelihood_method import BayesEStep, LikelihoodMStep
+from mpest.em.methods.method import Method
+from mpest.mixture_distribution import MixtureDistribution
+from mpest.models import GaussianModel, WeibullModelExp
+from mpest.optimizers import ScipyNewtonCG
+from mpest.problem import Problem
+
+
+def create_problem(model, params, start_params) -> Problem:
+    """Creates problem with mixture of two overlapping distributions"""
+
+    base_mixture = MixtureDistribution.from_distributions(
+        [Distribution.from_params(model, p) for p in params],
+        [0.4, 0.6],
+    )
+    return Problem(
+        base_mixture.generate(1000),
+        MixtureDistribution.from_distributions(
+            [Distribution.from_params(model, p) for p in start_params]
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    "model, params, start_params",
+    [
+        (GaussianModel, [[-1.0, 1.0], [1.0, 1.5]], [[-2.0, 2.0], [2.0, 2.0]]),
+        (WeibullModelExp, [[1.0, 1.0], [2.0, 3.0]], [[0.5, 2.0], [3.0, 1.0]]),
+    ],
+)
+def test_accelerated_em_likelihood(model, params, start_params):
+    """Checks that accelerated EM converges to the same mixture in fewer steps"""
+
+    np.random.seed(1)
+
+    problem = create_problem(model, params, start_params)
+    results = [
+        em_class(
+            StepCountBreakpointer(max_step=2000)
+            + ParamDifferBreakpointer(deviation=1e-6),
+            FiniteChecker() + PriorProbabilityThresholdChecker(),
+            Method(BayesEStep(), LikelihoodMStep(ScipyNewtonCG(), closed_form=True)),
+        ).solve_logged(problem)
+        for em_class in (EM, AcceleratedEM)
+    ]
+
+    assert 3 * results[1].log.steps < results[0].log.steps
+    for d_e, d_a in zip(results[0].content.content, results[1].content.content):
+        assert np.allclose(d_e.params, d_a.params, atol=1e-2)
+        assert np.isclose(d_e.prior_probability, d_a.prior_probability, atol=1e-2)
+
+
+def test_accelerated_em_l_moments():
+    """Checks that accelerated EM works with L-moments method"""
+
+    np.random.seed(1)
+
+    problem = create_problem(
+        GaussianModel, [[-1.0, 1.0], [1.0, 1.5]], [[-2.0, 2.0], [2.0, 2.0]]
+    )
+    results = [
+        em_class(
+            StepCountBreakpointer(max_step=400),
+            FiniteChecker() + PriorProbabilityThresholdChecker(),
+            Method(IndicatorEStep(), LMomentsMStep()),
+        ).solve(problem)
+        for em_class in (EM, AcceleratedEM)
+    ]
+
+    for d_e, d_a in zip(results[0].content, results[1].content):
+        assert np.allclose(d_e.params, d_a.params, atol=5e-2)
+        assert np.isclose(d_e.prior_probability, d_a.prior_probability, atol=5e-2)
+
+
+class RecordingBreakpointer(StepCountBreakpointer):
+    """Step count breakpointer, which records reported log-likelihoods"""
+
+    def __init__(self, max_step: int):
+        super().__init__(max_step=max_step)
+        self.log_likelihoods: list[float | None] = []
+
+    def update_log_likelihood(self, step: int, log_likelihood: float | None) -> None:
+        self.log_likelihoods.append(log_likelihood)
+
+
+def test_accelerated_em_log_likelihood():
+    """Checks that reported log-likelihood belongs to accepted steps"""
+
+    np.random.seed(1)
+
+    problem = create_problem(
+        GaussianModel, [[-1.0, 1.0], [1.0, 1.5]], [[-2.0, 2.0], [2.0, 2.0]]
+    )
+    breakpointer = RecordingBreakpointer(max_step=30)
+    AcceleratedEM(
+        breakpointer,
+        FiniteChecker() + PriorProbabilityThresholdChecker(),
+        Method(BayesEStep(), LikelihoodMStep(ScipyNewtonCG(), closed_form=True)),
+    ).solve(problem)
+
+    log_likelihoods = np.array(breakpointer.log_likelihoods)
+    assert len(log_likelihoods) == 30
+    assert np.all(np.diff(log_likelihoods) >= -1e-6)
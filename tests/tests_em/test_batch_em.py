@@ -0,0 +1,106 @@
+"""Unit test module which tests batched EM algorithm"""
+
+# pylint: disable=duplicate-code
+
+import numpy as np
+import pytest
+
+from mpest.distribution import Distribution
+from mpest.em import EM, BatchEM
+from mpest.em.breakpointers import StepCountBreakpointer
+from mpest.em.distribution_checkers import (
+    FiniteChecker,
+    PriorProbabilityThresholdChecker,
+)
+from mpest.em.methods.likelihood_method import BayesEStep, LikelihoodMStep
+from mpest.em.methods.method import Method
+from mpest.mixture_distribution import MixtureDistribution
+from mpest.models import AModel, ExponentialModel, GaussianModel, WeibullModelExp
+from mpest.optimizers import ScipyNewtonCG
+from mpest.problem import Problem
+
+
+def idfunc(vals):
+    """Function for customizing pytest ids"""
+
+    if isinstance(vals, AModel):
+        return vals.name
+    return f"{vals}"
+
+
+@pytest.mark.parametrize(
+    "model, params, start_params, max_step",
+    [
+        (GaussianModel(), [[-2.0, 1.0], [2.0, 1.5]], [[-1.0, 2.0], [1.0, 2.0]], 16),
+        (ExponentialModel(), [[0.5], [3.0]], [[0.2], [1.0]], 16),
+        (WeibullModelExp(), [[0.5, 1.0], [3.0, 2.0]], [[1.0, 0.5], [2.0, 1.5]], 4),
+    ],
+    ids=idfunc,
+)
+def test_batch_em(model: AModel, params, start_params, max_step):
+    """Checks that batched EM gives the same results as EM for each problem"""
+
+    np.random.seed(42)
+
+    base_mixture = MixtureDistribution.from_distributions(
+        [Distribution.from_params(model.__class__, p) for p in params],
+        [0.3, 0.7],
+    )
+    start_mixture = MixtureDistribution.from_distributions(
+        [Distribution.from_params(model.__class__, p) for p in start_params]
+    )
+    problems = [
+        Problem(base_mixture.generate(size), start_mixture) for size in (100, 250, 400)
+    ]
+
+    optimizer = ScipyNewtonCG()
+    em_algo = EM(
+        StepCountBreakpointer(max_step=max_step),
+        FiniteChecker() + PriorProbabilityThresholdChecker(),
+        Method(BayesEStep(), LikelihoodMStep(optimizer, closed_form=True)),
+    )
+    batch_em = BatchEM(max_step=max_step, tolerance=0.0, optimizer=optimizer)
+
+    for expected, actual in zip(
+        (em_algo.solve(problem) for problem in problems),
+        batch_em.solve_batch(problems),
+    ):
+        assert actual.error is None
+        for d_e, d_a in zip(expected.result, actual.result):
+            assert np.allclose(d_e.params, d_a.params, atol=1e-5)
+            assert np.isclose(d_e.prior_probability, d_a.prior_probability)
+
+
+class ScalarParamsExponentialModel(ExponentialModel):
+    """Exponential model, which lpdf_samples needs one-dimensional params"""
+
+    # pylint: disable=too-many-ancestors
+
+    @property
+    def params_broadcasting(self) -> bool:
+        return False
+
+    def lpdf_samples(self, samples, params):
+        l = float(params[0])
+        return np.where(samples < 0, -np.inf, l - np.exp(l) * samples)
+
+
+def test_batch_em_without_params_broadcasting():
+    """Checks that batched EM calculates pdf by rows for models without broadcasting"""
+
+    np.random.seed(42)
+    samples = [np.random.exponential(2.0, size) for size in (100, 250)]
+
+    problems = []
+    for model in (ExponentialModel(), ScalarParamsExponentialModel()):
+        start_mixture = MixtureDistribution.from_distributions(
+            [Distribution(model, np.array([0.2])), Distribution(model, np.array([1.0]))]
+        )
+        problems.append([Problem(x, start_mixture) for x in samples])
+
+    batch_em = BatchEM(max_step=8, tolerance=0.0)
+    expected, actual = (batch_em.solve_batch(p) for p in problems)
+    for r_e, r_a in zip(expected, actual):
+        assert r_a.error is None
+        for d_e, d_a in zip(r_e.result, r_a.result):
+            assert np.allclose(d_e.params, d_a.params)
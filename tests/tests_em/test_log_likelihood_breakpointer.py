@@ -0,0 +1,83 @@
+"""Unit test module which tests EM breakpointer by change of log-likelihood"""
+
+# pylint: disable=duplicate-code
+
+import numpy as np
+import pytest
+
+from mpest.distribution import Distribution
+from mpest.em import EM
+from mpest.em.breakpointers import LogLikelihoodBreakpointer, StepCountBreakpointer
+from mpest.em.distribution_checkers import (
+    FiniteChecker,
+    PriorProbabilityThresholdChecker,
+)
+from mpest.em.methods.l_moments_method import IndicatorEStep, LMomentsMStep
+from mpest.em.methods.likelihood_method import BayesEStep, LikelihoodMStep
+from mpest.em.methods.method import Method
+from mpest.em.multi_start_em import mixture_log_likelihood
+from mpest.mixture_distribution import MixtureDistribution
+from mpest.models import GaussianModel
+from mpest.optimizers import ScipyNewtonCG
+from mpest.problem import Problem
+
+
+def test_log_likelihood_breakpointer_patience():
+    """Checks tolerances and patience window of breakpointer"""
+
+    breakpointer = LogLikelihoodBreakpointer(rtol=1e-3, atol=0.5, patience=2)
+    mixture = MixtureDistribution([])
+
+    assert not breakpointer.is_over(0, None, mixture)
+    for step, (ll, expected) in enumerate(
+        [(-100.0, False), (-90.0, False), (-89.8, False), (-89.7, True)]
+    ):
+        breakpointer.update_log_likelihood(step, ll)
+        assert breakpointer.is_over(step + 1, mixture, mixture) == expected
+
+    breakpointer.update_log_likelihood(4, -80.0)
+    assert not breakpointer.is_over(5, mixture, mixture)
+    assert not breakpointer.is_over(0, None, mixture)
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        Method(BayesEStep(), LikelihoodMStep(ScipyNewtonCG(), closed_form=True)),
+        Method(IndicatorEStep(), LMomentsMStep()),
+    ],
+    ids=["Likelihood", "L-moments"],
+)
+def test_log_likelihood_breakpointer(method):
+    """Checks that EM stops by log-likelihood, calculated by E step"""
+
+    np.random.seed(42)
+
+    base_mixture = MixtureDistribution.from_distributions(
+        [
+            Distribution.from_params(GaussianModel, [-3.0, 1.0]),
+            Distribution.from_params(GaussianModel, [3.0, 1.0]),
+        ],
+        [0.4, 0.6],
+    )
+    x = base_mixture.generate(500)
+    problem = Problem(
+        x,
+        MixtureDistribution.from_distributions(
+            [
+                Distribution.from_params(GaussianModel, [-1.0, 2.0]),
+                Distribution.from_params(GaussianModel, [1.0, 2.0]),
+            ]
+        ),
+    )
+
+    em_algo = EM(
+        StepCountBreakpointer(max_step=256) + LogLikelihoodBreakpointer(rtol=1e-8),
+        FiniteChecker() + PriorProbabilityThresholdChecker(),
+        method,
+    )
+    result = em_algo.solve_logged(problem, True, True, True)
+
+    assert result.log.steps < 256
+    previous_step = result.log.log[-2].result.content
+    assert np.isclose(method.log_likelihood, mixture_log_likelihood(previous_step, x))
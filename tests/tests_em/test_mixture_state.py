@@ -0,0 +1,83 @@
+"""Unit test module which tests mixture state of EM algorithm"""
+
+import numpy as np
+
+from mpest.distribution import Distribution
+from mpest.em.mixture_state import MixtureState
+from mpest.mixture_distribution import MixtureDistribution
+from mpest.models import ExponentialModel, GaussianModel
+
+
+def test_mixture_state():
+    """Checks creation, materialization and updating of mixture state"""
+
+    mixture = MixtureDistribution.from_distributions(
+        [
+            Distribution(GaussianModel(), np.array([0.0, 1.0])),
+            Distribution(ExponentialModel(), np.array([0.5])),
+            Distribution(GaussianModel(), np.array([3.0, 2.0])),
+        ],
+        [0.2, 0.3, 0.5],
+    )
+
+    state = MixtureState.from_mixture(mixture)
+
+    assert len(state) == 3
+    assert state.params.shape == (3, 2)
+    assert list(state.model_ids) == [0, 1, 0]
+    for d_s, d in zip(state.mixture, mixture):
+        assert d_s.model.name == d.model.name
+        assert np.array_equal(d_s.params, d.params)
+        assert np.isclose(d_s.prior_probability, d.prior_probability)
+
+    previous = state.all_mixture
+    state.update(
+        MixtureDistribution.from_distributions(
+            [
+                Distribution(GaussianModel(), np.array([1.0, 1.0])),
+                Distribution(ExponentialModel(), np.array([1.5])),
+                Distribution(GaussianModel(), np.array([4.0, 2.0])),
+            ],
+            [0.2, 0.3, 0.5],
+        ),
+        lambda d: d.model.name != "Exponential",
+    )
+
+    assert len(state) == 2
+    assert np.allclose(state.priors, [0.2 / 0.7, 0.0, 0.5 / 0.7])
+    assert [d.prior_probability is None for d in state.all_mixture] == [
+        False,
+        True,
+        False,
+    ]
+    assert np.array_equal(state.mixture[1].params, [4.0, 2.0])
+    assert np.array_equal(previous[0].params, [0.0, 1.0])
+
+
+class OtherGaussianModel(GaussianModel):
+    """Gaussian model, which is another model with the same name"""
+
+    # pylint: disable=too-many-ancestors
+
+    @property
+    def name(self) -> str:
+        return "Gaussian"
+
+
+def test_mixture_state_models_with_same_name():
+    """Checks that different models with the same name aren't grouped together"""
+
+    mixture = MixtureDistribution.from_distributions(
+        [
+            Distribution(GaussianModel(), np.array([0.0, 1.0])),
+            Distribution(OtherGaussianModel(), np.array([3.0, 2.0])),
+        ]
+    )
+
+    state = MixtureState.from_mixture(mixture)
+
+    assert list(state.model_ids) == [0, 1]
+    assert [type(d.model) for d in state.mixture] == [
+        GaussianModel,
+        OtherGaussianModel,
+    ]
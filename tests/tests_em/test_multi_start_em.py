@@ -0,0 +1,125 @@
+"""Unit test module which tests EM algorithm with multiple initializations"""
+
+# pylint: disable=duplicate-code
+
+import numpy as np
+import pytest
+
+from mpest.distribution import Distribution
+from mpest.em import EM, MultiStartEM
+from mpest.em.breakpointers import ParamDifferBreakpointer, StepCountBreakpointer
+from mpest.em.distribution_checkers import (
+    FiniteChecker,
+    PriorProbabilityThresholdChecker,
+)
+from mpest.em.methods.likelihood_method import BayesEStep, LikelihoodMStep
+from mpest.em.methods.method import Method
+from mpest.em.multi_start_em import mixture_log_likelihood
+from mpest.mixture_distribution import MixtureDistribution
+from mpest.models import GaussianModel
+from mpest.optimizers import ScipyNewtonCG
+from mpest.problem import Problem
+from tests.utils import check_for_params_error_tolerance
+
+
+@pytest.mark.parametrize("processes", [False, True])
+def test_multi_start_em(processes):
+    """
+    Runs mixture of two gaussians parameter estimation from bad initialization
+    and random ones, checks that the best start is chosen
+    """
+
+    np.random.seed(42)
+
+    base_mixture = MixtureDistribution.from_distributions(
+        [
+            Distribution.from_params(GaussianModel, [-4.0, 1.0]),
+            Distribution.from_params(GaussianModel, [4.0, 1.0]),
+        ],
+        [0.5, 0.5],
+    )
+    x = base_mixture.generate(500)
+
+    problem = Problem(
+        x,
+        MixtureDistribution.from_distributions(
+            [
+                Distribution.from_params(GaussianModel, [10.0, 0.5]),
+                Distribution.from_params(GaussianModel, [12.0, 0.5]),
+            ]
+        ),
+    )
+
+    em_algo = EM(
+        StepCountBreakpointer(max_step=64) + ParamDifferBreakpointer(deviation=1e-4),
+        FiniteChecker() + PriorProbabilityThresholdChecker(),
+        Method(BayesEStep(), LikelihoodMStep(ScipyNewtonCG(), closed_form=True)),
+    )
+
+    def initialization(mixture: MixtureDistribution) -> MixtureDistribution:
+        return MixtureDistribution.from_distributions(
+            [
+                Distribution.from_params(
+                    GaussianModel, [np.random.uniform(-8.0, 8.0), 2.0]
+                )
+                for _ in mixture
+            ]
+        )
+
+    multi_start_em = MultiStartEM(
+        em_algo,
+        initialization,
+        starts=6,
+        round_steps=4,
+        cpu_count=2,
+        processes=processes,
+    )
+
+    single = em_algo.solve(problem)
+    result = multi_start_em.solve(problem)
+
+    assert mixture_log_likelihood(result.result, x) >= mixture_log_likelihood(
+        single.result, x
+    )
+    assert check_for_params_error_tolerance([result], base_mixture, 0.3)
+
+
+def test_multi_start_em_rounds():
+    """
+    Checks that single start, solved by rounds of one step,
+    stops on the same step as EM, whose breakpointer compares steps
+    """
+
+    np.random.seed(42)
+
+    base_mixture = MixtureDistribution.from_distributions(
+        [
+            Distribution.from_params(GaussianModel, [-2.0, 1.0]),
+            Distribution.from_params(GaussianModel, [2.0, 1.0]),
+        ],
+        [0.5, 0.5],
+    )
+    problem = Problem(
+        base_mixture.generate(500),
+        MixtureDistribution.from_distributions(
+            [
+                Distribution.from_params(GaussianModel, [-1.0, 2.0]),
+                Distribution.from_params(GaussianModel, [1.0, 2.0]),
+            ]
+        ),
+    )
+
+    em_algo = EM(
+        StepCountBreakpointer(max_step=64) + ParamDifferBreakpointer(deviation=1e-2),
+        FiniteChecker(),
+        Method(BayesEStep(), LikelihoodMStep(ScipyNewtonCG(), closed_form=True)),
+    )
+    multi_start_em = MultiStartEM(em_algo, [], starts=1, round_steps=1, max_rounds=64)
+
+    expected = em_algo.solve_logged(problem, True, False, False)
+    assert expected.log.steps < 64
+
+    result = multi_start_em.solve(problem)
+    for d_e, d_a in zip(expected.content.result, result.result):
+        assert np.allclose(d_e.params, d_a.params)
+        assert np.isclose(d_e.prior_probability, d_a.prior_probability)
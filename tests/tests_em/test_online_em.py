@@ -0,0 +1,60 @@
+"""Unit test module which tests online EM algorithm"""
+
+# pylint: disable=duplicate-code
+
+import numpy as np
+import pytest
+
+from mpest.distribution import Distribution
+from mpest.em import OnlineEM
+from mpest.em.distribution_checkers import (
+    FiniteChecker,
+    PriorProbabilityThresholdChecker,
+)
+from mpest.mixture_distribution import MixtureDistribution
+from mpest.models import ExponentialModel, GaussianModel, WeibullModelExp
+from tests.utils import (
+    check_for_params_error_tolerance,
+    check_for_priors_error_tolerance,
+)
+
+
+@pytest.mark.parametrize(
+    "model, params, start_params, expected_error",
+    [
+        (GaussianModel, [[-3.0, 1.0], [3.0, 2.0]], [[-1.0, 3.0], [1.0, 3.0]], 0.3),
+        (ExponentialModel, [[0.5], [5.0]], [[0.2], [1.0]], 0.5),
+    ],
+)
+def test_online_em(model, params, start_params, expected_error):
+    """Runs online EM on stream of batches and checks estimated mixture"""
+
+    np.random.seed(42)
+
+    base_mixture = MixtureDistribution.from_distributions(
+        [Distribution.from_params(model, p) for p in params],
+        [0.3, 0.7],
+    )
+    online_em = OnlineEM(
+        MixtureDistribution.from_distributions(
+            [Distribution.from_params(model, p) for p in start_params]
+        ),
+        distribution_checker=FiniteChecker() + PriorProbabilityThresholdChecker(),
+    )
+
+    result = online_em.fit(base_mixture.generate(100) for _ in range(200))
+
+    assert online_em.step == 200
+    assert check_for_params_error_tolerance([result], base_mixture, expected_error)
+    assert check_for_priors_error_tolerance([result], base_mixture, 0.1)
+
+
+def test_online_em_without_statistics():
+    """Checks that models without sufficient statistics are rejected"""
+
+    with pytest.raises(TypeError):
+        OnlineEM(
+            MixtureDistribution.from_distributions(
+                [Distribution.from_params(WeibullModelExp, [1.0, 1.0])]
+            )
+        )
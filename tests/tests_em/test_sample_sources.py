@@ -0,0 +1,93 @@
+"""Unit test module which tests sample sources"""
+
+# pylint: disable=duplicate-code
+
+import pickle
+
+import numpy as np
+import pytest
+
+from mpest.distribution import Distribution
+from mpest.em import EM
+from mpest.em.breakpointers import StepCountBreakpointer
+from mpest.em.distribution_checkers import FiniteChecker
+from mpest.em.methods.l_moments_method import IndicatorEStep, LMomentsMStep
+from mpest.em.methods.likelihood_method import BayesEStep, LikelihoodMStep
+from mpest.em.methods.method import Method
+from mpest.em.multi_start_em import mixture_log_likelihood
+from mpest.mixture_distribution import MixtureDistribution
+from mpest.models import GaussianModel
+from mpest.optimizers import ScipyNewtonCG
+from mpest.problem import Problem
+from mpest.sample_sources import ChunkedSamples, MemoryMappedSamples
+
+
+def test_sample_sources(tmp_path):
+    """Checks that sample sources give the same samples as array"""
+
+    np.random.seed(42)
+    x = np.random.normal(size=1000)
+
+    np.save(tmp_path / "samples.npy", x)
+    x.tofile(tmp_path / "samples.bin")
+    sources = [
+        MemoryMappedSamples(tmp_path / "samples.npy"),
+        MemoryMappedSamples(tmp_path / "samples.bin", raw=True),
+        ChunkedSamples(lambda: np.split(x, 4)),
+        pickle.loads(pickle.dumps(MemoryMappedSamples(tmp_path / "samples.npy"))),
+    ]
+
+    for source in sources:
+        assert len(source) == len(x)
+        chunks = list(Problem(source, MixtureDistribution([])).chunks(300))
+        assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]
+        assert np.array_equal(np.concatenate(chunks), x)
+        assert np.array_equal(np.asarray(source), x)
+        with pytest.raises(ValueError):
+            np.array(source, copy=False)
+
+
+def test_em_with_sample_source(tmp_path):
+    """Checks that EM gives the same results for memory-mapped samples and array"""
+
+    np.random.seed(42)
+
+    base_mixture = MixtureDistribution.from_distributions(
+        [
+            Distribution.from_params(GaussianModel, [-3.0, 1.0]),
+            Distribution.from_params(GaussianModel, [3.0, 2.0]),
+        ],
+        [0.4, 0.6],
+    )
+    x = base_mixture.generate(1000)
+    np.save(tmp_path / "samples.npy", x)
+    start_mixture = MixtureDistribution.from_distributions(
+        [
+            Distribution.from_params(GaussianModel, [-1.0, 3.0]),
+            Distribution.from_params(GaussianModel, [1.0, 3.0]),
+        ]
+    )
+
+    for steps in (
+        lambda: (BayesEStep(), LikelihoodMStep(ScipyNewtonCG())),
+        lambda: (IndicatorEStep(), LMomentsMStep()),
+    ):
+        results = [
+            EM(StepCountBreakpointer(16), FiniteChecker(), Method(*steps())).solve(
+                Problem(samples, start_mixture)
+            )
+            for samples in (x, MemoryMappedSamples(tmp_path / "samples.npy"))
+        ]
+        for d_a, d_m in zip(results[0].content, results[1].content):
+            assert np.allclose(d_a.params, d_m.params)
+
+    source = ChunkedSamples(lambda: np.split(x, 10))
+    assert np.isclose(
+        mixture_log_likelihood(base_mixture, source),
+        mixture_log_likelihood(base_mixture, x),
+    )
+
+    # Samples, which can be processed only by chunks, aren't read into memory
+    for e_step in (BayesEStep(), IndicatorEStep()):
+        with pytest.raises(TypeError):
+            e_step.step(Problem(source, start_mixture))
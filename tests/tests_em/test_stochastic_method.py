@@ -0,0 +1,124 @@
+"""Unit test module which tests stochastic method with batches of samples"""
+
+# pylint: disable=duplicate-code
+
+import numpy as np
+import pytest
+
+from mpest.distribution import Distribution
+from mpest.em import EM
+from mpest.em.breakpointers import StepCountBreakpointer
+from mpest.em.distribution_checkers import (
+    FiniteChecker,
+    PriorProbabilityThresholdChecker,
+)
+from mpest.em.methods.l_moments_method import IndicatorEStep, LMomentsMStep
+from mpest.em.methods.likelihood_method import (
+    BayesEStep,
+    ChunkedBayesEStep,
+    LikelihoodMStep,
+)
+from mpest.em.methods.method import Method
+from mpest.em.methods.stochastic_method import StochasticMethod
+from mpest.mixture_distribution import MixtureDistribution
+from mpest.models import GaussianModel
+from mpest.optimizers import ScipyNewtonCG
+from mpest.problem import Problem
+from mpest.sample_sources import ChunkedSamples, MemoryMappedSamples
+
+
+@pytest.mark.parametrize(
+    "steps",
+    [
+        lambda: (BayesEStep(), LikelihoodMStep(ScipyNewtonCG(), closed_form=True)),
+        lambda: (IndicatorEStep(), LMomentsMStep()),
+    ],
+    ids=["Likelihood", "L-moments"],
+)
+def test_stochastic_method(steps):
+    """Checks that stochastic method gives the same result as usual one after polishing"""
+
+    np.random.seed(42)
+
+    base_mixture = MixtureDistribution.from_distributions(
+        [
+            Distribution.from_params(GaussianModel, [-3.0, 1.0]),
+            Distribution.from_params(GaussianModel, [3.0, 2.0]),
+        ],
+        [0.4, 0.6],
+    )
+    problem = Problem(
+        base_mixture.generate(50000),
+        MixtureDistribution.from_distributions(
+            [
+                Distribution.from_params(GaussianModel, [-1.0, 3.0]),
+                Distribution.from_params(GaussianModel, [1.0, 3.0]),
+            ]
+        ),
+    )
+
+    stochastic_method = StochasticMethod(
+        *steps(), initial_batch_size=500, batch_growth=1.5, seed=42
+    )
+    results = [
+        EM(
+            StepCountBreakpointer(max_step=40),
+            FiniteChecker() + PriorProbabilityThresholdChecker(),
+            method,
+        ).solve(problem)
+        for method in (Method(*steps()), stochastic_method)
+    ]
+
+    assert stochastic_method.batch_size > len(problem.samples)
+    for d_e, d_s in zip(results[0].content, results[1].content):
+        assert np.allclose(d_e.params, d_s.params, atol=1e-2)
+        assert np.isclose(d_e.prior_probability, d_s.prior_probability, atol=1e-2)
+
+
+def test_stochastic_method_with_sample_source(tmp_path):
+    """
+    Checks that batches of samples sources are the same as batches of array.
+    All samples are used in the last steps,
+    so samples are processed by chunks in E step.
+    """
+
+    np.random.seed(42)
+
+    base_mixture = MixtureDistribution.from_distributions(
+        [
+            Distribution.from_params(GaussianModel, [-3.0, 1.0]),
+            Distribution.from_params(GaussianModel, [3.0, 2.0]),
+        ],
+        [0.4, 0.6],
+    )
+    x = base_mixture.generate(20000)
+    np.save(tmp_path / "samples.npy", x)
+    start_mixture = MixtureDistribution.from_distributions(
+        [
+            Distribution.from_params(GaussianModel, [-1.0, 3.0]),
+            Distribution.from_params(GaussianModel, [1.0, 3.0]),
+        ]
+    )
+
+    results = [
+        EM(
+            StepCountBreakpointer(max_step=8),
+            FiniteChecker() + PriorProbabilityThresholdChecker(),
+            StochasticMethod(
+                ChunkedBayesEStep(),
+                LikelihoodMStep(ScipyNewtonCG(), closed_form=True),
+                initial_batch_size=500,
+                seed=42,
+            ),
+        ).solve(Problem(samples, start_mixture))
+        for samples in (
+            x,
+            MemoryMappedSamples(tmp_path / "samples.npy"),
+            ChunkedSamples(lambda: np.array_split(x, 7)),
+        )
+    ]
+
+    for result in results[1:]:
+        for d_a, d_s in zip(results[0].content, result.content):
+            assert np.allclose(d_a.params, d_s.params)
+            assert np.isclose(d_a.prior_probability, d_s.prior_probability)
@@ -0,0 +1,26 @@
+"""Unit test module which tests sorting of samples in E step of L-moments method"""
+
+import numpy as np
+import pytest
+
+from mpest.em.methods.l_moments_method import IndicatorEStep
+
+
+def test_sort_samples():
+    """Checks that sort order is reused and samples can't be changed in place"""
+
+    np.random.seed(42)
+
+    samples = np.random.normal(size=100)
+    e_step = IndicatorEStep()
+
+    sorted_samples = e_step.sort_samples(samples)
+    assert np.array_equal(sorted_samples, np.sort(samples))
+    assert e_step.sort_samples(samples) is sorted_samples
+    assert e_step.sort_samples(sorted_samples) is sorted_samples
+
+    with pytest.raises(ValueError):
+        samples[0] = 0.0
+
+    other_samples = samples + 1.0
+    assert np.array_equal(e_step.sort_samples(other_samples), sorted_samples + 1.0)
@@ -0,0 +1,41 @@
+"""Unit test module which tests calculation of L-moments in M step of L-moments method"""
+
+from math import ceil
+
+import numpy as np
+
+from mpest.em.methods.l_moments_method import LMomentsMStep
+from mpest.utils import binom
+
+
+def naive_l_moment(r: int, samples, indicator) -> float:
+    """L-moment of order r, calculated directly by definition"""
+
+    n = len(samples)
+    l_moment = 0.0
+    for k in range(r):
+        b_num = sum(
+            binom(round(np.sum(indicator[: i + 1])), k) * samples[i] * indicator[i]
+            for i in range(k, n)
+        )
+        ind_sum = np.sum(indicator)
+        b_k = b_num / (ind_sum * binom(ceil(ind_sum), k))
+        l_moment += (-1) ** (r - k - 1) * binom(r - 1, k) * binom(r + k - 1, k) * b_k
+    return l_moment
+
+
+def test_calculate_l_moments():
+    """Checks vectorized L-moments calculation against direct one"""
+
+    np.random.seed(42)
+
+    samples = np.sort(np.random.normal(size=300))
+    indicators = np.random.dirichlet([1.0, 2.0, 3.0], size=300).T
+
+    l_moments = LMomentsMStep().calculate_l_moments(3, samples, indicators)
+
+    expected = [
+        [naive_l_moment(r, samples, indicator) for r in (1, 2, 3)]
+        for indicator in indicators
+    ]
+    assert np.allclose(l_moments, expected)
@@ -0,0 +1,51 @@
+"""Unit test module which tests E step of likelihood method"""
+
+import numpy as np
+
+from mpest.distribution import Distribution
+from mpest.em.methods.likelihood_method import BayesEStep
+from mpest.mixture_distribution import MixtureDistribution
+from mpest.models import ExponentialModel, GaussianModel
+from mpest.problem import Problem
+
+
+def test_bayes_e_step():
+    """Checks responsibility matrix against direct calculation"""
+
+    np.random.seed(42)
+
+    mixture = MixtureDistribution.from_distributions(
+        [
+            Distribution(GaussianModel(), np.array([0.0, 0.0])),
+            Distribution(ExponentialModel(), np.array([0.5])),
+        ],
+        [0.3, 0.7],
+    )
+    x = np.concatenate([np.random.uniform(-2.0, 5.0, 200), [-1.0, 0.0]])
+
+    active_samples, h, _ = BayesEStep().step(Problem(x, mixture))
+
+    p = np.array(
+        [[d.prior_probability * d.model.pdf(xi, d.params) for xi in x] for d in mixture]
+    )
+    assert np.array_equal(active_samples, x)
+    assert np.allclose(h, p / np.sum(p, axis=0))
+
+
+def test_bayes_e_step_underflow():
+    """Checks that samples with underflowed densities are not dropped"""
+
+    mixture = MixtureDistribution.from_distributions(
+        [
+            Distribution(GaussianModel(), np.array([0.0, 0.0])),
+            Distribution(GaussianModel(), np.array([1.0, 0.0])),
+        ],
+    )
+    x = np.array([-100.0, 0.0, 100.0])
+
+    active_samples, h, _ = BayesEStep().step(Problem(x, mixture))
+
+    assert np.array_equal(active_samples, x)
+    assert np.allclose(h[:, 0], [1.0, 0.0])
+    assert np.allclose(h[:, 2], [0.0, 1.0])
+    assert np.allclose(np.sum(h, axis=0), 1.0)
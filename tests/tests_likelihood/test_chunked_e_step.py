@@ -0,0 +1,85 @@
+"""Unit test module which tests chunked E step of likelihood method"""
+
+# pylint: disable=duplicate-code
+
+import numpy as np
+import pytest
+
+from mpest.distribution import Distribution
+from mpest.em import EM
+from mpest.em.breakpointers import StepCountBreakpointer
+from mpest.em.distribution_checkers import (
+    FiniteChecker,
+    PriorProbabilityThresholdChecker,
+)
+from mpest.em.methods.likelihood_method import (
+    BayesEStep,
+    ChunkedBayesEStep,
+    LikelihoodMStep,
+)
+from mpest.em.methods.method import Method
+from mpest.mixture_distribution import MixtureDistribution
+from mpest.models import ExponentialModel, GaussianModel, WeibullModelExp
+from mpest.optimizers import ScipyNewtonCG
+from mpest.problem import Problem
+from mpest.sample_sources import ChunkedSamples
+
+
+@pytest.mark.parametrize(
+    "model, params, start_params",
+    [
+        (GaussianModel, [[-3.0, 1.0], [3.0, 2.0]], [[-1.0, 3.0], [1.0, 3.0]]),
+        (ExponentialModel, [[0.5], [5.0]], [[0.2], [1.0]]),
+    ],
+)
+def test_chunked_e_step(model, params, start_params):
+    """Checks that chunked E step gives the same results as usual one"""
+
+    np.random.seed(42)
+
+    base_mixture = MixtureDistribution.from_distributions(
+        [Distribution.from_params(model, p) for p in params],
+        [0.4, 0.6],
+    )
+    x = base_mixture.generate(1000)
+    start_mixture = MixtureDistribution.from_distributions(
+        [Distribution.from_params(model, p) for p in start_params]
+    )
+
+    e_step = ChunkedBayesEStep(memory_budget=8 * 1024)
+    assert e_step.chunk_size(start_mixture) < len(x)
+
+    results = [
+        EM(
+            StepCountBreakpointer(max_step=16),
+            FiniteChecker() + PriorProbabilityThresholdChecker(),
+            method,
+        ).solve(problem)
+        for method, problem in (
+            (
+                Method(BayesEStep(), LikelihoodMStep(ScipyNewtonCG(), True)),
+                Problem(x, start_mixture),
+            ),
+            (
+                Method(e_step, LikelihoodMStep(ScipyNewtonCG())),
+                Problem(ChunkedSamples(lambda: np.split(x, 8)), start_mixture),
+            ),
+        )
+    ]
+
+    for d_e, d_c in zip(results[0].content, results[1].content):
+        assert np.allclose(d_e.params, d_c.params)
+        assert np.isclose(d_e.prior_probability, d_c.prior_probability)
+
+
+def test_chunked_e_step_without_statistics():
+    """Checks that models without sufficient statistics are rejected"""
+
+    problem = Problem(
+        np.ones(10),
+        MixtureDistribution.from_distributions(
+            [Distribution.from_params(WeibullModelExp, [1.0, 1.0])]
+        ),
+    )
+    with pytest.raises(TypeError):
+        ChunkedBayesEStep().step(problem)
@@ -0,0 +1,135 @@
+"""Unit test module which tests closed form M step of likelihood method"""
+
+# pylint: disable=duplicate-code
+
+import numpy as np
+import pytest
+from scipy.optimize import minimize
+
+from mpest.distribution import Distribution
+from mpest.em import EM, BatchEM
+from mpest.em.breakpointers import ParamDifferBreakpointer, StepCountBreakpointer
+from mpest.em.distribution_checkers import (
+    FiniteChecker,
+    PriorProbabilityThresholdChecker,
+)
+from mpest.em.methods.likelihood_method import (
+    BayesEStep,
+    ChunkedBayesEStep,
+    LikelihoodMStep,
+)
+from mpest.em.methods.method import Method
+from mpest.mixture_distribution import MixtureDistribution
+from mpest.models import AModelWithSufficientStatistics, ExponentialModel, GaussianModel
+from mpest.optimizers import ScipyNelderMead
+from mpest.problem import Problem
+from tests.utils import check_for_params_error_tolerance
+
+
+def idfunc(vals):
+    """Function for customizing pytest ids"""
+
+    if isinstance(vals, AModelWithSufficientStatistics):
+        return vals.name
+    return f"{vals}"
+
+
+@pytest.mark.parametrize(
+    "model, params",
+    [
+        (GaussianModel(), (1.0, 2.0)),
+        (ExponentialModel(), (0.5,)),
+    ],
+    ids=idfunc,
+)
+def test_weighted_mle(model: AModelWithSufficientStatistics, params):
+    """Checks that closed form solution maximizes weighted likelihood"""
+
+    np.random.seed(42)
+
+    x = model.generate(np.array(params), 500, normalized=False)
+    weights = np.random.uniform(0.0, 1.0, 500)
+
+    expected = minimize(
+        lambda p: -np.sum(weights * model.lpdf_samples(x, p)),
+        model.params_convert_to_model(np.array(params)),
+        method="Nelder-Mead",
+        options={"xatol": 1e-8, "fatol": 1e-8},
+    ).x
+
+    assert np.allclose(model.weighted_mle(x, weights), expected, atol=1e-4)
+
+
+@pytest.mark.parametrize("mean, sd", [(1e6, 1e-3), (1e7, 1e-2)])
+def test_closed_form_far_from_zero(mean, sd):
+    """
+    Checks that closed form solutions stay accurate for samples,
+    whose mean is much greater than their standard deviation
+    """
+
+    np.random.seed(42)
+
+    model = GaussianModel()
+    x = np.random.normal(mean, sd, 100000)
+    expected = np.array([np.mean(x), np.log(np.std(x))])
+
+    assert np.allclose(model.weighted_mle(x, np.ones(len(x))), expected)
+
+    problem = Problem(
+        x,
+        MixtureDistribution.from_distributions(
+            [Distribution(model, np.array([mean, np.log(10 * sd)]))]
+        ),
+    )
+    e_result = ChunkedBayesEStep(memory_budget=2**16).step(problem)
+    result = LikelihoodMStep(ScipyNelderMead()).step(e_result)
+    assert np.allclose(result.result[0].params, expected)
+
+    result = BatchEM(max_step=2).solve(problem, normalize=False)
+    assert np.allclose(result.result[0].params, expected)
+
+
+def test_closed_form_em():
+    """
+    Runs mixture of two gaussians parameter estimation with closed form M step
+    and compares it with the optimizer one
+    """
+
+    np.random.seed(42)
+
+    base_mixture = MixtureDistribution.from_distributions(
+        [
+            Distribution.from_params(GaussianModel, [-3.0, 1.0]),
+            Distribution.from_params(GaussianModel, [3.0, 2.0]),
+        ],
+        [0.4, 0.6],
+    )
+    x = base_mixture.generate(1000)
+
+    problem = Problem(
+        x,
+        MixtureDistribution.from_distributions(
+            [
+                Distribution.from_params(GaussianModel, [-1.0, 3.0]),
+                Distribution.from_params(GaussianModel, [1.0, 3.0]),
+            ]
+        ),
+    )
+
+    results = []
+    for closed_form in (True, False):
+        em_algo = EM(
+            StepCountBreakpointer(max_step=64)
+            + ParamDifferBreakpointer(deviation=1e-4),
+            FiniteChecker() + PriorProbabilityThresholdChecker(),
+            Method(
+                BayesEStep(),
+                LikelihoodMStep(ScipyNelderMead(), closed_form=closed_form),
+            ),
+        )
+        results.append(em_algo.solve(problem))
+
+    assert check_for_params_error_tolerance(results[:1], base_mixture, 0.4)
+    for d_c, d_o in zip(results[0].result, results[1].result):
+        assert np.allclose(d_c.params, d_o.params, atol=1e-3)
+        assert np.isclose(d_c.prior_probability, d_o.prior_probability, atol=1e-3)
@@ -0,0 +1,48 @@
+"""Unit test module which tests sufficient statistics passed from E step to M step"""
+
+import numpy as np
+
+from mpest.distribution import Distribution
+from mpest.em.methods.likelihood_method import BayesEStep, ChunkedBayesEStep
+from mpest.mixture_distribution import MixtureDistribution
+from mpest.models import ExponentialModel, GaussianModel
+from mpest.problem import Problem
+
+
+def test_mixture_statistics():
+    """
+    Checks that statistics of parts of samples are merged into statistics of all samples
+    and that they are the same as weighted sums of sufficient statistics
+    """
+
+    np.random.seed(42)
+
+    x = np.random.exponential(2.0, size=1000)
+    problem = Problem(
+        x,
+        MixtureDistribution.from_distributions(
+            [
+                Distribution(GaussianModel(), np.array([1.0, 0.0])),
+                Distribution(ExponentialModel(), np.array([-1.0])),
+            ],
+            [0.3, 0.7],
+        ),
+    )
+
+    e_step = ChunkedBayesEStep(memory_budget=None)
+    statistics = e_step.step(problem)
+    shift = statistics.shift
+    merged = e_step.chunk_statistics(x[:300], problem, shift) + e_step.chunk_statistics(
+        x[300:], problem, shift
+    )
+
+    samples, h, _ = BayesEStep().step(problem)
+    for j, d in enumerate(problem.distributions):
+        expected = np.sum(d.model.sufficient_statistics(samples, shift) * h[j], axis=-1)
+        assert len(expected) == d.model.statistics_count
+        assert np.allclose(statistics.statistics[j], expected)
+        assert np.allclose(merged.statistics[j], expected)
+
+    assert np.allclose(merged.weights, np.sum(h, axis=1))
+    assert merged.count == statistics.count == len(samples)
+    assert np.isclose(merged.log_likelihood, e_step.log_likelihood)
@@ -0,0 +1,53 @@
+"""Unit test module which tests parallel M step of likelihood method"""
+
+# pylint: disable=duplicate-code
+
+import copy
+
+import numpy as np
+import pytest
+
+from mpest.distribution import Distribution
+from mpest.em.methods.likelihood_method import BayesEStep, LikelihoodMStep
+from mpest.mixture_distribution import MixtureDistribution
+from mpest.models import WeibullModelExp
+from mpest.optimizers import ScipyNelderMead, ScipyNewtonCG
+from mpest.problem import Problem
+
+
+@pytest.mark.parametrize("optimizer", [ScipyNewtonCG(), ScipyNelderMead()])
+@pytest.mark.parametrize("processes", [False, True])
+def test_parallel_m_step(optimizer, processes):
+    """Checks that parallel M step gives the same results as sequential one"""
+
+    np.random.seed(42)
+
+    mixture = MixtureDistribution.from_distributions(
+        [
+            Distribution.from_params(WeibullModelExp, [k, l])
+            for k, l in [(0.5, 1.0), (1.0, 2.0), (2.0, 3.0), (3.0, 5.0)]
+        ]
+    )
+    problem = Problem(mixture.generate(500), mixture)
+    e_result = BayesEStep().step(
+        Problem(
+            problem.samples,
+            MixtureDistribution.from_distributions(
+                [
+                    Distribution(d.model, d.model.params_convert_to_model(d.params))
+                    for d in mixture
+                ]
+            ),
+        )
+    )
+
+    expected = LikelihoodMStep(optimizer).step(e_result).content
+    with LikelihoodMStep(optimizer, workers=4, processes=processes) as m_step:
+        actual = m_step.step(e_result).content
+
+        # pool of workers isn't copied
+        assert copy.deepcopy(m_step).workers == 4
+
+    for d_e, d_a in zip(expected, actual):
+        assert np.allclose(d_e.params, d_a.params)
+        assert np.isclose(d_e.prior_probability, d_a.prior_probability)
@@ -0,0 +1,67 @@
+"""Unit test module which tests sharded E step of likelihood method"""
+
+# pylint: disable=duplicate-code
+
+import numpy as np
+import pytest
+
+from mpest.distribution import Distribution
+from mpest.em import EM
+from mpest.em.breakpointers import StepCountBreakpointer
+from mpest.em.distribution_checkers import (
+    FiniteChecker,
+    PriorProbabilityThresholdChecker,
+)
+from mpest.em.methods.likelihood_method import ChunkedBayesEStep, LikelihoodMStep
+from mpest.em.methods.method import Method
+from mpest.em.methods.sharded_e_step import ShardedBayesEStep
+from mpest.mixture_distribution import MixtureDistribution
+from mpest.models import ExponentialModel, GaussianModel
+from mpest.optimizers import ScipyNewtonCG
+from mpest.problem import Problem
+from mpest.sample_sources import ChunkedSamples
+
+
+@pytest.mark.parametrize(
+    "model, params, start_params",
+    [
+        (GaussianModel, [[-3.0, 1.0], [3.0, 2.0]], [[-1.0, 3.0], [1.0, 3.0]]),
+        (ExponentialModel, [[0.5], [5.0]], [[0.2], [1.0]]),
+    ],
+)
+def test_sharded_e_step(model, params, start_params):
+    """Checks that sharded E step gives the same results as chunked one"""
+
+    np.random.seed(42)
+
+    base_mixture = MixtureDistribution.from_distributions(
+        [Distribution.from_params(model, p) for p in params],
+        [0.4, 0.6],
+    )
+    x = base_mixture.generate(1000)
+    start_mixture = MixtureDistribution.from_distributions(
+        [Distribution.from_params(model, p) for p in start_params]
+    )
+
+    with ShardedBayesEStep(workers=3, memory_budget=8 * 1024) as e_step:
+        results = [
+            EM(
+                StepCountBreakpointer(max_step=16),
+                FiniteChecker() + PriorProbabilityThresholdChecker(),
+                method,
+            ).solve(problem)
+            for method, problem in (
+                (
+                    Method(ChunkedBayesEStep(), LikelihoodMStep(ScipyNewtonCG())),
+                    Problem(x, start_mixture),
+                ),
+                (
+                    Method(e_step, LikelihoodMStep(ScipyNewtonCG())),
+                    Problem(ChunkedSamples(lambda: np.split(x, 8)), start_mixture),
+                ),
+            )
+        ]
+
+    for d_c, d_s in zip(results[0].content, results[1].content):
+        assert np.allclose(d_c.params, d_s.params)
+        assert np.isclose(d_c.prior_probability, d_s.prior_probability)
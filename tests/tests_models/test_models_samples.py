@@ -0,0 +1,50 @@
+"""Unit test module which tests vectorized methods of models"""
+
+import numpy as np
+import pytest
+
+from mpest.models import (
+    AModelDifferentiable,
+    ExponentialModel,
+    GaussianModel,
+    WeibullModelExp,
+)
+
+
+def idfunc(vals):
+    """Function for customizing pytest ids"""
+
+    if isinstance(vals, AModelDifferentiable):
+        return vals.name
+    return f"{vals}"
+
+
+@pytest.mark.parametrize(
+    "model, params",
+    [
+        (WeibullModelExp(), (0.5, 0.5)),
+        (WeibullModelExp(), (2.0, 1.5)),
+        (GaussianModel(), (0.0, 5.0)),
+        (GaussianModel(), (-1.0, 0.3)),
+        (ExponentialModel(), (1.0,)),
+        (ExponentialModel(), (3.0,)),
+    ],
+    ids=idfunc,
+)
+def test_samples_methods(model: AModelDifferentiable, params):
+    """Checks that vectorized methods are the same as scalar ones"""
+
+    np.random.seed(42)
+
+    params = model.params_convert_to_model(np.array(params))
+    x = np.concatenate([np.random.uniform(-3.0, 10.0, 100), [-1.0, 0.5, 7.0]])
+
+    pdf = [model.pdf(xi, params) for xi in x]
+    lpdf = [model.lpdf(xi, params) for xi in x]
+    ld_params = np.transpose([model.ld_params(xi, params) for xi in x])
+
+    assert model.pdf_samples(x, params).shape == x.shape
+    assert np.allclose(model.pdf_samples(x, params), pdf)
+    assert np.allclose(model.lpdf_samples(x, params), lpdf)
+    assert model.ld_params_samples(x, params).shape == (len(params), len(x))
+    assert np.allclose(model.ld_params_samples(x, params), ld_params)